@@ -68,22 +68,15 @@ async def upload_file(
     if not file.filename:
         raise HTTPException(status_code=400, detail="No filename provided")
 
-    is_valid, error_msg = service.validate_file(file.filename, file.content_type, 0)
-    if not is_valid:
-        raise HTTPException(status_code=400, detail=error_msg)
-
-    file_content = await file.read()
-    file_size = len(file_content)
-
     is_valid, error_msg = service.validate_file(
-        file.filename, file.content_type, file_size
+        file.filename, file.content_type, file.size or 0
     )
     if not is_valid:
         raise HTTPException(status_code=400, detail=error_msg)
 
     try:
         uploaded_file = await service.save_upload_file(
-            file_content=file_content,
+            file_stream=file.file,
             original_filename=file.filename,
             content_type=file.content_type,
         )
@@ -100,6 +93,8 @@ async def upload_file(
 
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}") from e
 
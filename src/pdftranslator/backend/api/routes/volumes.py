@@ -71,9 +71,9 @@ async def delete_volume(
 
 def _volume_to_response(volume, include_chapters: bool = False) -> dict:
     """Convert volume to response dict."""
-    chapter_repo = ChapterRepository(DatabasePool.get_instance())
     chapters = []
     if include_chapters:
+        chapter_repo = ChapterRepository(DatabasePool.get_instance())
         chapters = [
             {"id": c.id, "chapter_number": c.chapter_number, "title": c.title}
             for c in chapter_repo.get_by_volume(volume.id)
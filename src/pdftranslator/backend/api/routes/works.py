@@ -12,6 +12,7 @@ from pdftranslator.backend.api.models.schemas import (
 )
 from pdftranslator.database.connection import DatabasePool
 from pdftranslator.database.repositories.book_repository import BookRepository
+from pdftranslator.database.repositories.chapter_repository import ChapterRepository
 from pdftranslator.database.repositories.volume_repository import VolumeRepository
 
 router = APIRouter(prefix="/api/works", tags=["works"])
@@ -105,26 +106,26 @@ async def delete_work(
 
 def _work_to_response(work, include_volumes: bool = False) -> dict:
     """Convert work to response dict."""
-    volume_repo = VolumeRepository(DatabasePool.get_instance())
-    from pdftranslator.database.repositories.chapter_repository import ChapterRepository
+    pool = DatabasePool.get_instance()
+    volume_repo = VolumeRepository(pool)
 
     volumes = []
     total_chapters = 0
     translated_chapters = 0
 
     work_volumes = volume_repo.get_by_work_id(work.id)
+    # One repository for all volumes: each instance builds its own vector store.
+    chapter_repo = ChapterRepository(pool) if work_volumes else None
     for v in work_volumes:
-        chapter_repo = ChapterRepository(DatabasePool.get_instance())
-        chapters = chapter_repo.get_by_volume(v.id)
-        total_chapters += len(chapters)
-        vol_translated = sum(1 for c in chapters if c.translated_text)
+        vol_total, vol_translated = chapter_repo.count_by_volume(v.id)
+        total_chapters += vol_total
         translated_chapters += vol_translated
 
         volumes.append(
             {
                 "id": v.id,
                 "volume_number": v.volume_number,
-                "total_chapters": len(chapters),
+                "total_chapters": vol_total,
                 "translated_chapters": vol_translated,
             }
         )
@@ -6,6 +6,7 @@ import re
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
 
 from pdftranslator.core.config.settings import Settings
 from pdftranslator.database.models import UploadedFile, Volume, Work
@@ -29,6 +30,7 @@ ALLOWED_MIME_TYPES = {
 }
 MAX_FILE_SIZE_MB = 300
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 @dataclass
@@ -98,17 +100,30 @@ class FileService:
 
     async def save_upload_file(
         self,
-        file_content: bytes,
+        file_stream: BinaryIO,
         original_filename: str,
         content_type: str | None,
     ) -> UploadedFile:
+        """Stream an upload to disk in fixed-size blocks.
+
+        Raises:
+            ValueError: If the stream exceeds MAX_FILE_SIZE_BYTES.
+        """
         unique_filename = self.generate_unique_filename(original_filename)
         file_path = self._upload_dir / unique_filename
 
+        file_size = 0
         with open(file_path, "wb") as f:
-            f.write(file_content)
+            for block in iter(lambda: file_stream.read(UPLOAD_CHUNK_SIZE), b""):
+                file_size += len(block)
+                if file_size > MAX_FILE_SIZE_BYTES:
+                    break
+                f.write(block)
+
+        if file_size > MAX_FILE_SIZE_BYTES:
+            self._cleanup_file(file_path)
+            raise ValueError(f"File size exceeds {MAX_FILE_SIZE_MB}MB limit")
 
-        file_size = len(file_content)
         file_type = Path(original_filename).suffix.lower().lstrip(".")
 
         uploaded_file = UploadedFile(
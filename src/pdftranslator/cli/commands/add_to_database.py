@@ -1,8 +1,10 @@
 import logging
+import multiprocessing
 import re
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import questionary
 import typer
@@ -19,7 +21,10 @@ from pdftranslator.cli.app import app, console, VALID_EXTENSIONS
 from pdftranslator.database.models import Work, Volume
 from pdftranslator.database.repositories.book_repository import BookRepository
 from pdftranslator.database.repositories.volume_repository import VolumeRepository
-from pdftranslator.tools.TextExtractor import TextExtractor
+from pdftranslator.tools.TextExtractor import (
+    DEFAULT_EXTRACTION_WORKERS,
+    TextExtractor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -135,11 +140,81 @@ def process_single_file(
         )
 
 
-def process_files(files: List[Path]) -> List[ProcessingResult]:
+def _extract_text_worker(file_path: str) -> Optional[str]:
+    """Extract the text of one file inside a worker process."""
+    # Files are already spread across processes; keep each PDF in one process
+    return TextExtractor(max_workers=1).extract_text(file_path)
+
+
+class _PrefetchedExtractor:
+    """
+    TextExtractor stand-in that hands out texts extracted in a process pool.
+
+    Lets process_single_file keep its sequential database logic while the
+    extraction of every selected file already runs in parallel.
+    """
+
+    def __init__(self, futures: Dict[str, Future]):
+        self._futures = futures
+
+    def extract_text(self, file_path: str) -> Optional[str]:
+        future = self._futures.pop(file_path, None)
+        if future is None:
+            return _extract_text_worker(file_path)
+        return future.result()
+
+    def cancel_pending(self) -> None:
+        """Cancel extractions whose result was never requested."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+
+
+def _files_to_extract(
+    files: List[Path], work_repo: BookRepository, volume_repo: VolumeRepository
+) -> List[Path]:
+    """
+    Returns the files process_single_file will actually extract.
+
+    Unparseable names, volumes already in the database and repeated volumes
+    in the selection are rejected before extraction, so they are not sent to
+    the process pool either.
+    """
+    pending: List[Path] = []
+    seen: Set[Tuple[str, int]] = set()
+    existing_volumes: Dict[str, Set[int]] = {}
+    for file_path in files:
+        parsed = parse_filename(file_path)
+        if not parsed:
+            continue
+        key = (parsed.title, parsed.volume_number)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        try:
+            if parsed.title not in existing_volumes:
+                works = work_repo.find_by_title(parsed.title, fuzzy=False)
+                volumes = volume_repo.get_by_work_id(works[0].id) if works else []
+                existing_volumes[parsed.title] = {v.volume_number for v in volumes}
+        except Exception as e:
+            # process_single_file reports the error and extracts in-process
+            logger.warning(
+                f"Could not check existing volumes for {file_path.name}: {e}"
+            )
+            continue
+
+        if parsed.volume_number not in existing_volumes[parsed.title]:
+            pending.append(file_path)
+    return pending
+
+
+def process_files(
+    files: List[Path], num_workers: int = DEFAULT_EXTRACTION_WORKERS
+) -> List[ProcessingResult]:
     results: List[ProcessingResult] = []
     work_repo = BookRepository()
     volume_repo = VolumeRepository()
-    extractor = TextExtractor()
 
     with Progress(
         SpinnerColumn(),
@@ -150,11 +225,43 @@ def process_files(files: List[Path]) -> List[ProcessingResult]:
     ) as progress:
         task = progress.add_task("[cyan]Procesando archivos...", total=len(files))
 
-        for file_path in files:
-            progress.update(task, description=f"[cyan]Procesando: {file_path.name}")
-            result = process_single_file(file_path, work_repo, volume_repo, extractor)
-            results.append(result)
-            progress.advance(task)
+        to_extract = (
+            _files_to_extract(files, work_repo, volume_repo)
+            if len(files) > 1 and num_workers > 1
+            else []
+        )
+        if len(to_extract) > 1:
+            # Spawned, not forked: rich's refresh thread is already running
+            with ProcessPoolExecutor(
+                max_workers=min(num_workers, len(to_extract)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                extractor = _PrefetchedExtractor(
+                    {
+                        str(f): executor.submit(_extract_text_worker, str(f))
+                        for f in to_extract
+                    }
+                )
+                # Database writes stay in this process, in selection order
+                for file_path in files:
+                    progress.update(
+                        task, description=f"[cyan]Procesando: {file_path.name}"
+                    )
+                    result = process_single_file(
+                        file_path, work_repo, volume_repo, extractor
+                    )
+                    results.append(result)
+                    progress.advance(task)
+                extractor.cancel_pending()
+        else:
+            extractor = TextExtractor(max_workers=DEFAULT_EXTRACTION_WORKERS)
+            for file_path in files:
+                progress.update(task, description=f"[cyan]Procesando: {file_path.name}")
+                result = process_single_file(
+                    file_path, work_repo, volume_repo, extractor
+                )
+                results.append(result)
+                progress.advance(task)
 
     return results
 
@@ -184,10 +291,14 @@ def print_results(results: List[ProcessingResult]) -> None:
 
 
 def scan_directory_for_files(directory_path: Path) -> List[Path]:
-    files = []
-    for ext in VALID_EXTENSIONS:
-        files.extend(directory_path.rglob(f"*{ext}"))
-    return sorted(files)
+    # One traversal for every extension; skip our own translated_* outputs
+    return sorted(
+        path
+        for path in directory_path.rglob("*")
+        if path.suffix.lower() in VALID_EXTENSIONS
+        and "translated_" not in path.name
+        and path.is_file()
+    )
 
 
 def handle_single_file(file_path: Path) -> List[Path]:
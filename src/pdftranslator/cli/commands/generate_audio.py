@@ -1,6 +1,9 @@
 """Generate audio from translated chapters/volumes."""
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
@@ -39,6 +42,31 @@ def _get_chapter_sort_key(chapter: Chapter) -> tuple:
         return (1, chapter.chapter_number)
 
 
+def _get_volume_audio_dir(settings: Settings, work: Work, volume: Volume) -> Path:
+    """Directory holding the audio files of a volume."""
+    work_title = work.title.replace(" ", "_")
+    return settings.paths.audiobooks_dir / work_title / f"Vol{volume.volume_number}"
+
+
+def _get_chapter_audio_filename(work: Work, volume: Volume, chapter: Chapter) -> str:
+    """File name of the audio generated for a chapter."""
+    work_title = work.title.replace(" ", "_")
+    ch_num = chapter.chapter_number if chapter.chapter_number is not None else 0
+    return f"{work_title}_Vol{volume.volume_number}_Ch{ch_num:03d}.m4a"
+
+
+def _list_existing_audio(audio_dir: Path) -> set[str]:
+    """List the audio file names already present in a volume directory.
+
+    A single directory scan replaces one stat call per chapter.
+    """
+    try:
+        with os.scandir(audio_dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
 def _format_chapter_display(chapter: Chapter) -> str:
     """Format a chapter for display."""
     if chapter.chapter_number is None:
@@ -78,7 +106,6 @@ def _display_work_structure(
         return {"volumes": 0, "chapters": 0, "generated": 0, "pending": 0}
 
     settings = Settings.get()
-    work_title = work.title.replace(" ", "_")
 
     total_chapters = 0
     total_generated = 0
@@ -88,19 +115,15 @@ def _display_work_structure(
 
     for volume in sorted(volumes, key=lambda v: v.volume_number):
         chapters = chapter_repo.get_by_volume(volume.id) if volume.id else []
+        existing_audio = _list_existing_audio(
+            _get_volume_audio_dir(settings, work, volume)
+        )
 
         generated = 0
         pending = 0
         for ch in chapters:
             if ch.translated_text:
-                ch_num = ch.chapter_number if ch.chapter_number is not None else 0
-                output_path = (
-                    settings.paths.audiobooks_dir
-                    / work_title
-                    / f"Vol{volume.volume_number}"
-                    / f"{work_title}_Vol{volume.volume_number}_Ch{ch_num:03d}.m4a"
-                )
-                if output_path.exists():
+                if _get_chapter_audio_filename(work, volume, ch) in existing_audio:
                     generated += 1
                 else:
                     pending += 1
@@ -124,17 +147,10 @@ def _display_work_structure(
 
         for ch in sorted(chapters, key=_get_chapter_sort_key)[:5]:
             ch_display = _format_chapter_display(ch)
-            ch_num = ch.chapter_number if ch.chapter_number is not None else 0
-            output_path = (
-                settings.paths.audiobooks_dir
-                / work_title
-                / f"Vol{volume.volume_number}"
-                / f"{work_title}_Vol{volume.volume_number}_Ch{ch_num:03d}.m4a"
-            )
 
             if not ch.translated_text:
                 ch_status = "[dim]○ no translation[/dim]"
-            elif output_path.exists():
+            elif _get_chapter_audio_filename(work, volume, ch) in existing_audio:
                 ch_status = "[green]✓ audio[/green]"
             else:
                 ch_status = "[yellow]○ pending[/yellow]"
@@ -244,7 +260,9 @@ def _select_chapter_interactive(
         )
         return None
 
-    work_title = work.title.replace(" ", "_")
+    existing_audio = _list_existing_audio(
+        _get_volume_audio_dir(settings, work, volume)
+    )
 
     chapter_choices = []
     for ch in sorted(chapters, key=_get_chapter_sort_key):
@@ -252,14 +270,7 @@ def _select_chapter_interactive(
         if not ch.translated_text:
             status = " [dim](○ no translation)[/dim]"
         else:
-            ch_num = ch.chapter_number if ch.chapter_number is not None else 0
-            output_path = (
-                settings.paths.audiobooks_dir
-                / work_title
-                / f"Vol{volume.volume_number}"
-                / f"{work_title}_Vol{volume.volume_number}_Ch{ch_num:03d}.m4a"
-            )
-            if output_path.exists():
+            if _get_chapter_audio_filename(work, volume, ch) in existing_audio:
                 status = " [green](✓ audio)[/green]"
             else:
                 status = " [yellow](○ pending)[/yellow]"
@@ -284,22 +295,16 @@ def _generate_chapter_audio(
     volume: Volume,
     work: Work,
     settings: Settings,
+    audio_generator: Optional[AudioGenerator] = None,
 ) -> bool:
-    """Generate audio for a single chapter."""
+    """Generate audio for a single chapter, reusing audio_generator if given."""
     if not chapter.translated_text or not chapter.translated_text.strip():
         console.print(f"[yellow]Chapter has no translated text. Skipping.[/yellow]")
         return False
 
-    work_title = work.title.replace(" ", "_")
-    output_dir = (
-        settings.paths.audiobooks_dir / work_title / f"Vol{volume.volume_number}"
-    )
+    output_dir = _get_volume_audio_dir(settings, work, volume)
     output_dir.mkdir(parents=True, exist_ok=True)
-
-    ch_num = chapter.chapter_number if chapter.chapter_number is not None else 0
-    output_filename = (
-        output_dir / f"{work_title}_Vol{volume.volume_number}_Ch{ch_num:03d}.m4a"
-    )
+    output_filename = output_dir / _get_chapter_audio_filename(work, volume, chapter)
 
     if output_filename.exists():
         console.print(
@@ -310,7 +315,8 @@ def _generate_chapter_audio(
     ch_display = _format_chapter_display(chapter)
     console.print(f"[cyan]Generating audio for {ch_display}...[/cyan]")
 
-    audio_generator = AudioGenerator()
+    if audio_generator is None:
+        audio_generator = AudioGenerator()
     success = audio_generator.process_texts(
         text_content=chapter.translated_text,
         output_filename=output_filename,
@@ -324,13 +330,52 @@ def _generate_chapter_audio(
         return False
 
 
+def _generate_chapters_parallel(
+    chapters: list[Chapter],
+    volume: Volume,
+    work: Work,
+    settings: Settings,
+    workers: int,
+) -> list[tuple[Chapter, bool]]:
+    """
+    Generate audio for several chapters concurrently.
+
+    AudioGenerator keeps per-run state (its temp directory), so each worker
+    thread builds and reuses its own instance. The cores are split between
+    the instances so `workers` chapters don't each start a 'say' per core.
+    """
+    local = threading.local()
+    synthesis_workers = max(1, (os.cpu_count() or 1) // workers)
+
+    def generate(chapter: Chapter) -> bool:
+        if not hasattr(local, "audio_generator"):
+            local.audio_generator = AudioGenerator(max_workers=synthesis_workers)
+        return _generate_chapter_audio(
+            chapter, volume, work, settings, local.audio_generator
+        )
+
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(generate, chapter): chapter for chapter in chapters}
+        for future in as_completed(futures):
+            chapter = futures[future]
+            try:
+                results.append((chapter, future.result()))
+            except Exception as e:
+                logger.error(f"Audio generation failed for chapter {chapter.id}: {e}")
+                results.append((chapter, False))
+    return results
+
+
 def _generate_volume_audio(
     volume: Volume,
     work: Work,
     settings: Settings,
     chapter_repo: ChapterRepository,
+    audio_generator: Optional[AudioGenerator] = None,
+    workers: int = 1,
 ) -> tuple[int, int, int]:
-    """Generate audio for all chapters in a volume."""
+    """Generate audio for all chapters in a volume, `workers` at a time."""
     chapters = chapter_repo.get_by_volume(volume.id)
     if not chapters:
         console.print(
@@ -344,8 +389,22 @@ def _generate_volume_audio(
     fail_count = 0
     skip_count = 0
 
-    for chapter in chapters:
-        result = _generate_chapter_audio(chapter, volume, work, settings)
+    if workers > 1 and len(chapters) > 1:
+        results = _generate_chapters_parallel(
+            chapters, volume, work, settings, workers
+        )
+    else:
+        results = (
+            (
+                chapter,
+                _generate_chapter_audio(
+                    chapter, volume, work, settings, audio_generator
+                ),
+            )
+            for chapter in chapters
+        )
+
+    for chapter, result in results:
         if result:
             success_count += 1
         else:
@@ -362,6 +421,8 @@ def _generate_book_audio(
     settings: Settings,
     volume_repo: VolumeRepository,
     chapter_repo: ChapterRepository,
+    audio_generator: Optional[AudioGenerator] = None,
+    workers: int = 1,
 ) -> tuple[int, int, int]:
     """Generate audio for all volumes and chapters in a work."""
     if work.id is None:
@@ -380,7 +441,7 @@ def _generate_book_audio(
     for volume in sorted(volumes, key=lambda v: v.volume_number):
         console.print(f"\n[bold]Volume {volume.volume_number}[/bold]")
         success, skip, fail = _generate_volume_audio(
-            volume, work, settings, chapter_repo
+            volume, work, settings, chapter_repo, audio_generator, workers
         )
         total_success += success
         total_skip += skip
@@ -394,6 +455,9 @@ def generate_audio(
     voice: Optional[str] = typer.Option(
         None, "--voice", help="TTS voice (default: from config)"
     ),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1, help="Chapters to synthesize in parallel"
+    ),
 ):
     """
     Generate audio from translated text in database.
@@ -407,6 +471,7 @@ def generate_audio(
     Examples:
         pdftranslator generate-audio
         pdftranslator generate-audio --voice "Paulina"
+        pdftranslator generate-audio --workers 2
     """
     setup_logging()
 
@@ -427,6 +492,9 @@ def generate_audio(
         raise typer.Exit(0)
 
     settings = Settings.get()
+    # One generator (voice lookup, NLTK splitter) shared by every chapter on
+    # the sequential path; parallel workers build their own per thread
+    audio_generator = AudioGenerator() if workers == 1 else None
 
     total_success = 0
     total_skip = 0
@@ -434,7 +502,12 @@ def generate_audio(
 
     if selected_scope == SCOPE_ALL_BOOK:
         total_success, total_skip, total_fail = _generate_book_audio(
-            selected_work, settings, volume_repo, chapter_repo
+            selected_work,
+            settings,
+            volume_repo,
+            chapter_repo,
+            audio_generator,
+            workers,
         )
 
     elif selected_scope == SCOPE_ALL_VOLUME:
@@ -443,7 +516,12 @@ def generate_audio(
             raise typer.Exit(0)
 
         total_success, total_skip, total_fail = _generate_volume_audio(
-            selected_volume, selected_work, settings, chapter_repo
+            selected_volume,
+            selected_work,
+            settings,
+            chapter_repo,
+            audio_generator,
+            workers,
         )
 
     elif selected_scope == SCOPE_SINGLE_CHAPTER:
@@ -459,7 +537,11 @@ def generate_audio(
 
         if selected_chapter.translated_text:
             success = _generate_chapter_audio(
-                selected_chapter, selected_volume, selected_work, settings
+                selected_chapter,
+                selected_volume,
+                selected_work,
+                settings,
+                audio_generator,
             )
             total_success = 1 if success else 0
             total_fail = 0 if success else 1
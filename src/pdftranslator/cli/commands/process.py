@@ -1,5 +1,6 @@
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Tuple
 
@@ -26,7 +27,10 @@ from pdftranslator.cli.app import (
 from pdftranslator.core.config.settings import Settings
 from pdftranslator.tools.AudioGenerator import AudioGenerator
 from pdftranslator.tools.FileFinder import FileFinder, IsFileFilter, ExcludeTranslatedFilter
-from pdftranslator.tools.TextExtractor import TextExtractor
+from pdftranslator.tools.TextExtractor import (
+    DEFAULT_EXTRACTION_WORKERS,
+    TextExtractor,
+)
 from pdftranslator.tools.Translator import Translator
 
 
@@ -88,36 +92,41 @@ def prepare_output_paths(
     return dynamic_output_dir, output_audio_filename
 
 
-def process_single_file(
+def review_single_file(
     file_path: Path,
-    services: Tuple,
-    source_lang: str,
     target_lang: str,
     output_format: str,
-) -> bool:
-    translation_agent, audio_generator = services
+    text_extractor: Optional[TextExtractor] = None,
+) -> Tuple[bool, Optional[Tuple[str, Path]]]:
+    """
+    Extract a file and let the user review the text before translation.
 
+    Returns (ok, reviewed): ok is False when the file failed, and reviewed
+    holds the reviewed text and the audio path still to be generated, or None
+    when the audio file already exists.
+    """
     logging.info(f"\n--- Processing file: {os.path.basename(file_path)} ---")
 
     output_paths = prepare_output_paths(file_path, target_lang, output_format)
     if not output_paths:
-        return False
+        return False, None
     _, output_audio_filename = output_paths
 
     if output_audio_filename.exists():
         logging.info(
             f" - Audio file already exists: {output_audio_filename}. Skipping."
         )
-        return True
+        return True, None
 
-    text_extractor = TextExtractor()
+    if text_extractor is None:
+        text_extractor = TextExtractor(max_workers=DEFAULT_EXTRACTION_WORKERS)
     original_text = text_extractor.extract_text(file_path=file_path)
 
     if not original_text or not original_text.strip():
         logging.warning(
             f" - Could not extract text or text is empty for {os.path.basename(file_path)}. Skipping file."
         )
-        return False
+        return False, None
     logging.info(
         f" - Original text extracted (length: {len(original_text)} characters)"
     )
@@ -143,18 +152,52 @@ def process_single_file(
 
     except Exception as e:
         logging.error(f"Error durante la validación del usuario: {e}")
-        return False
+        return False, None
     finally:
         if temp_text_file_path.exists():
             temp_text_file_path.unlink()
             logging.info(f"Archivo temporal eliminado: {temp_text_file_path}")
 
+    return True, (original_text, output_audio_filename)
+
+
+def translate_single_file(
+    file_path: Path,
+    translation_agent: Translator,
+    source_lang: str,
+    target_lang: str,
+    output_format: str,
+    text_extractor: Optional[TextExtractor] = None,
+) -> Tuple[bool, Optional[Tuple[str, Path]]]:
+    """
+    Extract, review and translate a file.
+
+    Returns (ok, pending_audio): ok is False when the file failed, and
+    pending_audio holds the translated text and the audio path still to be
+    generated, or None when the audio file already exists.
+    """
+    ok, reviewed = review_single_file(
+        file_path, target_lang, output_format, text_extractor
+    )
+    if not ok or reviewed is None:
+        return ok, None
+
+    original_text, output_audio_filename = reviewed
     translated_text = translate_text(
         translation_agent, original_text, file_path, source_lang, target_lang
     )
     if translated_text is None:
-        return False
+        return False, None
+
+    return True, (translated_text, output_audio_filename)
+
 
+def generate_file_audio(
+    audio_generator: AudioGenerator,
+    translated_text: str,
+    output_audio_filename: Path,
+    file_path: Path,
+) -> bool:
     audio_success = generate_audio(
         audio_generator, translated_text, output_audio_filename, file_path
     )
@@ -168,6 +211,27 @@ def process_single_file(
     return True
 
 
+def process_single_file(
+    file_path: Path,
+    services: Tuple,
+    source_lang: str,
+    target_lang: str,
+    output_format: str,
+) -> bool:
+    translation_agent, audio_generator = services
+
+    ok, pending_audio = translate_single_file(
+        file_path, translation_agent, source_lang, target_lang, output_format
+    )
+    if not ok or pending_audio is None:
+        return ok
+
+    translated_text, output_audio_filename = pending_audio
+    return generate_file_audio(
+        audio_generator, translated_text, output_audio_filename, file_path
+    )
+
+
 def initialize_services() -> Optional[Tuple]:
     try:
         translation_agent = Translator()
@@ -203,30 +267,98 @@ def process_files_with_progress(
 
     console.print(f"[green]Found {len(files_to_process)} files to process[/green]")
 
+    translation_agent, audio_generator = services
+    text_extractor = TextExtractor(max_workers=DEFAULT_EXTRACTION_WORKERS)
     successful_file_count = 0
     failed_file_count = 0
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task(
-            "[cyan]Processing files...", total=len(files_to_process)
-        )
-
-        for file_path in files_to_process:
-            progress.update(task, description=f"[cyan]Processing: {file_path.name}")
-            success = process_single_file(
-                file_path, services, source_lang, target_lang, output_format
+    # (translated_text, audio_path, file_path) waiting for the next review
+    deferred_audio: Optional[Tuple[str, Path, Path]] = None
+    audio_future: Optional[Future] = None
+
+    # Audio for one file is generated on a single background worker while the
+    # next file is translated. One worker keeps the shared AudioGenerator from
+    # running two files at once. The job only runs between review prompts, so
+    # its progress and logs never scroll over the "pulse Enter" prompt.
+    audio_executor = ThreadPoolExecutor(max_workers=1)
+    interrupted = False
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task(
+                "[cyan]Processing files...", total=len(files_to_process)
             )
-            if success:
-                successful_file_count += 1
-            else:
-                failed_file_count += 1
-            progress.advance(task)
+
+            def finish_audio() -> None:
+                """Wait for the background audio job and count its file."""
+                nonlocal audio_future, successful_file_count, failed_file_count
+                if audio_future is None:
+                    return
+                if audio_future.result():
+                    successful_file_count += 1
+                else:
+                    failed_file_count += 1
+                audio_future = None
+                progress.advance(task)
+
+            def start_audio() -> None:
+                """Submit the audio of the last translated file, if any."""
+                nonlocal audio_future, deferred_audio
+                if deferred_audio is None:
+                    return
+                audio_future = audio_executor.submit(
+                    generate_file_audio, audio_generator, *deferred_audio
+                )
+                deferred_audio = None
+
+            for file_path in files_to_process:
+                progress.update(
+                    task, description=f"[cyan]Processing: {file_path.name}"
+                )
+                finish_audio()
+                ok, reviewed = review_single_file(
+                    file_path, target_lang, output_format, text_extractor
+                )
+                start_audio()
+
+                if ok and reviewed is not None:
+                    original_text, output_audio_filename = reviewed
+                    translated_text = translate_text(
+                        translation_agent,
+                        original_text,
+                        file_path,
+                        source_lang,
+                        target_lang,
+                    )
+                    if translated_text is not None:
+                        deferred_audio = (
+                            translated_text,
+                            output_audio_filename,
+                            file_path,
+                        )
+                        continue
+                    ok = False
+
+                if ok:
+                    successful_file_count += 1
+                else:
+                    failed_file_count += 1
+                progress.advance(task)
+
+            finish_audio()
+            start_audio()
+            finish_audio()
+    except KeyboardInterrupt:
+        interrupted = True
+        raise
+    finally:
+        # On Ctrl+C a queued audio job is dropped instead of blocking the exit
+        # until it has finished
+        audio_executor.shutdown(wait=not interrupted, cancel_futures=interrupted)
 
     return successful_file_count, failed_file_count
 
@@ -7,7 +7,6 @@ para proporcionar contexto de traducción más preciso.
 """
 
 import logging
-import re
 from typing import List, Optional
 
 import questionary
@@ -29,9 +28,9 @@ from pdftranslator.database.repositories.book_repository import BookRepository
 from pdftranslator.database.repositories.chapter_repository import ChapterRepository
 from pdftranslator.database.repositories.volume_repository import VolumeRepository
 from pdftranslator.database.repositories.glossary_repository import GlossaryRepository
-from pdftranslator.infrastructure.llm.base import BCP47Language
 from pdftranslator.tools.Translator import Translator
 from pdftranslator.core.config.settings import Settings
+from pdftranslator.core.text_patterns import TRIPLE_NEWLINE_PATTERN
 
 logger = logging.getLogger(__name__)
 
@@ -324,6 +323,9 @@ class GlossaryAwareTranslator(Translator):
     - Fewer API calls for same text
     """
 
+    # Transient backend errors are retried before giving up on a chunk
+    _MAX_CHUNK_ATTEMPTS = 3
+
     def __init__(
         self,
         glossary_entries: List[GlossaryEntry],
@@ -340,41 +342,6 @@ class GlossaryAwareTranslator(Translator):
         self.glossary_entries = glossary_entries
         self._post_processor = None
 
-    def _get_translation_prompt_template(
-        self, source_lang: str, target_lang: str
-    ) -> str:
-        """
-        Get the standard translation prompt template.
-
-        Note: Glossary is no longer included in prompt.
-        Use GlossaryPostProcessor for term consistency.
-
-        Returns:
-            The translation prompt template.
-        """
-        with open(
-            self._settings.paths.translation_prompt_path, "r", encoding="utf-8"
-        ) as f:
-            return f.read()
-
-    def _get_language_for_split(self, source_lang: str) -> BCP47Language:
-        """Map source language to BCP47Language enum."""
-        lang_map = {
-            "en": BCP47Language.ENGLISH,
-            "es": BCP47Language.SPANISH,
-            "zh": BCP47Language.CHINESE,
-            "ja": BCP47Language.JAPANESE,
-            "ko": BCP47Language.KOREAN,
-            "fr": BCP47Language.FRENCH,
-            "de": BCP47Language.GERMAN,
-            "it": BCP47Language.ITALIAN,
-            "pt": BCP47Language.PORTUGUESE,
-            "ru": BCP47Language.RUSSIAN,
-            "ar": BCP47Language.ARABIC,
-            "hi": BCP47Language.HINDI,
-        }
-        return lang_map.get(source_lang.lower(), BCP47Language.ENGLISH)
-
     def translate_text(self, full_text: str, source_lang: str, target_lang: str) -> str:
         """
         Translate text with post-processing for glossary consistency.
@@ -403,7 +370,9 @@ class GlossaryAwareTranslator(Translator):
         logger.info("Translation of all chunks completed.")
 
         full_translated_text = "\n\n".join(translated_parts)
-        full_translated_text = re.sub(r"\n{3,}", "\n\n", full_translated_text).strip()
+        full_translated_text = TRIPLE_NEWLINE_PATTERN.sub(
+            "\n\n", full_translated_text
+        ).strip()
 
         if self.glossary_entries:
             logger.info(
@@ -417,59 +386,6 @@ class GlossaryAwareTranslator(Translator):
 
         return full_translated_text
 
-    def _translate_single_chunk(
-        self, chunk: str, chunk_index: int, base_prompt_template: str
-    ) -> str:
-        """
-        Translate a single chunk (no glossary in prompt).
-
-        Args:
-            chunk: Text chunk to translate
-            chunk_index: Index of the chunk (for logging)
-            base_prompt_template: Prompt template to use
-
-        Returns:
-            Translated chunk or error marker
-        """
-        prompt = base_prompt_template.format(
-            text_chunk=chunk,
-            source_lang=self._current_source_lang,
-            target_lang=self._current_target_lang,
-        )
-
-        prompt_tokens = self.llm_client.count_tokens(prompt)
-        logger.debug(f"Chunk {chunk_index + 1}: Prompt total = {prompt_tokens} tokens")
-
-        try:
-            translated_chunk = self.llm_client.call_model(prompt)
-            return translated_chunk if translated_chunk is not None else ""
-        except Exception as e:
-            logger.error(f"Error during LLM call for chunk {chunk_index + 1}: {e}")
-            return self._translate_single_chunk(chunk, chunk_index, base_prompt_template)
-
-    def _translate_chunks(
-        self, chunks: list[str], source_lang: str, target_lang: str
-    ) -> list[str]:
-        """Translate all chunks with progress tracking."""
-        self._current_source_lang = source_lang
-        self._current_target_lang = target_lang
-
-        translated_chunks = []
-        prompt_template = self._get_translation_prompt_template(
-            source_lang, target_lang
-        )
-
-        if self._progress:
-            iterator = self._progress(enumerate(chunks), desc="Translating Chunks...")
-        else:
-            iterator = enumerate(chunks)
-
-        for i, chunk in iterator:
-            translated_chunk = self._translate_single_chunk(chunk, i, prompt_template)
-            translated_chunks.append(translated_chunk)
-
-        return translated_chunks
-
 
 def _translate_chapter(
     chapter: Chapter,
@@ -221,15 +221,13 @@ class GlossaryPostProcessor:
         original_term = entry.term
         correction_count = 0
 
-        # Pattern to find the original term (should be present)
-        pattern = re.compile(r"\b" + re.escape(original_term) + r"\b", re.IGNORECASE)
-
-        # Find all matches
-        matches = list(pattern.finditer(text))
+        # Pattern to find the original term (should be present), compiled once
+        # per entry in _generate_variants
+        pattern = variants["incorrect_patterns"][0]
 
         # If no matches, the term might have been translated - we can't easily detect this
         # without knowing what it was translated to. Log a warning.
-        if not matches:
+        if not pattern.search(text):
             logger.warning(
                 f"DO NOT TRANSLATE term '{original_term}' not found in text - "
                 "may have been translated"
@@ -253,30 +251,24 @@ class GlossaryPostProcessor:
         Returns:
             Tuple of (corrected text, correction count)
         """
-        original_term = entry.term
         correct_translation = entry.translation
         correction_count = 0
 
-        # Pattern to find the original term
-        pattern = re.compile(r"\b" + re.escape(original_term) + r"\b", re.IGNORECASE)
+        # Pattern to find the original term, compiled once per entry in
+        # _generate_variants
+        pattern = variants["incorrect_patterns"][0]
 
-        # Find matches and check if they need correction
-        # Process in reverse to maintain correct positions
-        for match in reversed(list(pattern.finditer(text))):
+        def _replace(match: re.Match) -> str:
+            nonlocal correction_count
             found_term = match.group()
-
-            # Check if it's already the correct translation (case-insensitive)
-            if found_term.lower() == correct_translation.lower():
-                # Already correct, but might need case adjustment
-                expected_case = self._match_case(found_term, correct_translation)
-                if found_term != expected_case:
-                    text = text[: match.start()] + expected_case + text[match.end() :]
-                    correction_count += 1
-            else:
-                # Need to replace with correct translation
-                replacement = self._match_case(found_term, correct_translation)
-                text = text[: match.start()] + replacement + text[match.end() :]
+            # Already-correct terms only change when their case differs
+            replacement = self._match_case(found_term, correct_translation)
+            if replacement != found_term:
                 correction_count += 1
+            return replacement
+
+        # A single substitution pass instead of re-slicing the text per match
+        text = pattern.sub(_replace, text)
 
         return text, correction_count
 
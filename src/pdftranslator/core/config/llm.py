@@ -140,11 +140,27 @@ class NvidiaConfig(BaseSettings):
 class OllamaConfig(BaseModel):
     """Ollama local LLM configuration."""
 
+    # Recommended override: an explicit Q4_K_M tag such as
+    # "llama3.2:3b-instruct-q4_K_M" (pull it first). Decode is memory-bandwidth
+    # bound, so 4-bit weights roughly double tokens/s over FP16 at
+    # near-identical quality; use q5_K_M or q8_0 when there is VRAM to spare.
     model_name: str = Field(default="llama3.2")
     temperature: float = Field(default=0.3, ge=0.0, le=2.0)
     top_p: float = Field(default=0.9, ge=0.0, le=1.0)
     context_size: int = Field(default=4096, gt=0)
+    # num_ctx holds prompt, chunk and translation together, so chunks are
+    # sized to leave room for the other two (see OllamaLLM.split_into_limit)
+    chunk_safety_margin_pct: float = Field(default=0.10, ge=0.0, le=0.30)
+    min_chunk_tokens: int = Field(default=256, gt=0)
+    expansion_ratios: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Custom ratios: 'en-es': 1.3, 'en-zh': 0.6, etc."
+    )
     validate_model: bool = Field(default=True)
+    # How long the server keeps the model in memory after a request ("-1" for
+    # forever) and whether to load it up front instead of on the first chunk.
+    keep_alive: str = Field(default="30m")
+    preload_model: bool = Field(default=True)
     # Matches llama3.2 (different from llama3.1)
     local_tokenizer_name: str = Field(default="meta-llama/Llama-3.2-1B")
     local_tokenizer_dir: str = Field(default=".tokenizers/ollama")
@@ -15,4 +15,9 @@ class ProcessingSettings(BaseModel):
     output_format: str = Field(default="m4a", description="Audio output format")
     voice: str = Field(default="Paulina", description="macOS 'say' voice for TTS")
     gen_video: bool = Field(default=False, description="Generate video from audio")
+    translation_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="LLM chunk requests in flight at once (match OLLAMA_NUM_PARALLEL)",
+    )
     develop_mode: bool = Field(default=True, description="Enable development features")
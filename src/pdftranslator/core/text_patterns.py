@@ -0,0 +1,10 @@
+"""Regular expressions shared by the text extraction and translation code."""
+
+import re
+
+# Runs of three or more newlines, collapsed to one blank line between paragraphs
+TRIPLE_NEWLINE_PATTERN = re.compile(r"\n{3,}")
+
+# Chunks made only of digits, punctuation and whitespace (page numbers, scene
+# breaks) carry nothing to translate
+UNTRANSLATABLE_CHUNK_PATTERN = re.compile(r"[\W\d_]*")
@@ -152,6 +152,30 @@ class ChapterRepository(BaseRepository[Chapter]):
             rows = cur.fetchall()
             return [self._row_to_chapter(row) for row in rows]
 
+    def count_by_volume(self, volume_id: int) -> tuple[int, int]:
+        """
+        Count the chapters of a volume without loading their texts.
+
+        Returns:
+            (total_chapters, translated_chapters)
+        """
+        with self._pool.connection() as conn:
+            cur = conn.execute(
+                """
+                SELECT COUNT(*),
+                       COALESCE(SUM(CASE WHEN translated_text IS NOT NULL
+                                          AND translated_text != ''
+                                         THEN 1 ELSE 0 END), 0)
+                FROM chapters
+                WHERE volume_id = ?
+                """,
+                (volume_id,),
+            )
+            row = cur.fetchone()
+            if row is None:
+                return 0, 0
+            return row[0], row[1]
+
     def search_content(
         self, volume_id: int, query: str, limit: int = 10
     ) -> List[Chapter]:
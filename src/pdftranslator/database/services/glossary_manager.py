@@ -14,7 +14,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from pdftranslator.database.connection import DatabasePool
 from pdftranslator.database.models import (
@@ -144,6 +144,7 @@ class GlossaryManager:
         batch_size = self._calculate_validation_batch_size()
         batches = self._split_into_batches(entities, batch_size)
 
+        pending_ids = self._get_pending_ids_by_text(work_id, volume_id, "extracted")
         validated_entities = []
         for i, batch in enumerate(batches):
             logger.info(
@@ -153,13 +154,9 @@ class GlossaryManager:
             validated_entities.extend(batch_validated)
 
             # Update progress after each batch
-            batch_entity_texts = [e.text for e in batch_validated]
-            pending = self._progress_repo.get_pending_for_phase(
-                work_id, volume_id, "extracted"
+            matching_ids = self._take_pending_ids(
+                pending_ids, (e.text for e in batch_validated)
             )
-            matching_ids = [
-                p.id for p in pending if p.entity_text in batch_entity_texts
-            ]
             if matching_ids:
                 self._progress_repo.batch_update_phase(matching_ids, "validated", i + 1)
 
@@ -186,6 +183,7 @@ class GlossaryManager:
         batch_size = self._calculate_validation_batch_size()
         batches = self._split_into_batches(entities, batch_size)
 
+        pending_ids = self._get_pending_ids_by_text(work_id, volume_id, "extracted")
         validated_entities = []
         for i, batch in enumerate(batches):
             logger.info(
@@ -203,13 +201,9 @@ class GlossaryManager:
                 )
 
             # Update progress after each batch
-            batch_entity_texts = [e.text for e in batch_validated]
-            pending = self._progress_repo.get_pending_for_phase(
-                work_id, volume_id, "extracted"
+            matching_ids = self._take_pending_ids(
+                pending_ids, (e.text for e in batch_validated)
             )
-            matching_ids = [
-                p.id for p in pending if p.entity_text in batch_entity_texts
-            ]
             if matching_ids:
                 self._progress_repo.batch_update_phase(matching_ids, "validated", i + 1)
 
@@ -235,19 +229,24 @@ class GlossaryManager:
 
         self._ensure_llm()
 
-        # If entities already have translations from validation, use them
-        if all(e.translation for e in entities):
+        # Entities already translated during validation are reused as-is
+        all_translations, untranslated = self._split_by_translation(entities)
+        if not untranslated:
             logger.info("Using translations from LLM validation")
             if progress and task_id is not None:
                 progress.update(
                     task_id, completed=len(entities), advance=len(entities)
                 )
-            return {e.text: e.translation for e in entities}, 0
+            return all_translations, 0
 
-        batch_size = self._calculate_translation_batch_size(len(entities))
-        batches = self._split_into_batches(entities, batch_size)
+        if progress and task_id is not None and all_translations:
+            progress.update(task_id, advance=len(all_translations))
 
-        all_translations = {}
+        batch_size = self._calculate_translation_batch_size(len(untranslated))
+        batches = self._split_into_batches(untranslated, batch_size)
+
+        pending_ids = self._get_pending_ids_by_text(work_id, volume_id, "validated")
+        self._mark_reused_translations(pending_ids, all_translations)
         for i, batch in enumerate(batches):
             logger.info(
                 f"Translating batch {i + 1}/{len(batches)} ({len(batch)} entities)"
@@ -264,13 +263,7 @@ class GlossaryManager:
                 )
 
             # Update progress after each batch
-            batch_entity_texts = list(batch_translations.keys())
-            pending = self._progress_repo.get_pending_for_phase(
-                work_id, volume_id, "validated"
-            )
-            matching_ids = [
-                p.id for p in pending if p.entity_text in batch_entity_texts
-            ]
+            matching_ids = self._take_pending_ids(pending_ids, batch_translations)
             if matching_ids:
                 self._progress_repo.batch_update_phase(
                     matching_ids, "translated", i + 1
@@ -278,6 +271,60 @@ class GlossaryManager:
 
         return all_translations, len(batches)
 
+    def _split_by_translation(
+        self, entities: List[EntityCandidate]
+    ) -> tuple[Dict[str, str], List[EntityCandidate]]:
+        """
+        Separate entities already translated during validation from the rest.
+
+        Returns (existing_translations, untranslated_entities), so only the
+        untranslated entities are sent to the LLM.
+        """
+        existing: Dict[str, str] = {}
+        untranslated: List[EntityCandidate] = []
+        for e in entities:
+            if e.translation:
+                existing[e.text] = e.translation
+            else:
+                untranslated.append(e)
+        if existing and untranslated:
+            logger.info(
+                f"Reusing {len(existing)} translations from LLM validation, "
+                f"translating {len(untranslated)} remaining entities"
+            )
+        return existing, untranslated
+
+    def _mark_reused_translations(
+        self, pending_ids: Dict[str, List[int]], translations: Dict[str, str]
+    ) -> None:
+        """Advance progress rows whose translation came from validation."""
+        matching_ids = self._take_pending_ids(pending_ids, translations)
+        if matching_ids:
+            self._progress_repo.batch_update_phase(matching_ids, "translated", 0)
+
+    def _get_pending_ids_by_text(
+        self, work_id: int, volume_id: int, phase: str
+    ) -> Dict[str, List[int]]:
+        """
+        Index the progress rows pending for a phase by entity text.
+
+        Fetched once per stage so each batch update is a dict lookup
+        instead of a new query plus a linear scan.
+        """
+        pending_ids: Dict[str, List[int]] = {}
+        for p in self._progress_repo.get_pending_for_phase(work_id, volume_id, phase):
+            pending_ids.setdefault(p.entity_text, []).append(p.id)
+        return pending_ids
+
+    def _take_pending_ids(
+        self, pending_ids: Dict[str, List[int]], entity_texts: Iterable[str]
+    ) -> List[int]:
+        """Pop the progress ids for the given entity texts out of the index."""
+        matching_ids = []
+        for text in entity_texts:
+            matching_ids.extend(pending_ids.pop(text, ()))
+        return matching_ids
+
     def _calculate_validation_batch_size(self) -> int:
         """
         Calculate optimal batch size for validation.
@@ -786,16 +833,16 @@ Respond ONLY as JSON (no explanation):
 
         self._ensure_llm()
 
-        # If entities already have translations from validation, use them
-        if all(e.translation for e in entities):
+        # Entities already translated during validation are reused as-is
+        all_translations, untranslated = self._split_by_translation(entities)
+        if not untranslated:
             logger.info("Using translations from LLM validation")
-            return {e.text: e.translation for e in entities}
+            return all_translations
 
-        # Otherwise, calculate batches and translate
-        batch_size = self._calculate_translation_batch_size(len(entities))
-        batches = self._split_into_batches(entities, batch_size)
+        # Otherwise, calculate batches and translate only the missing ones
+        batch_size = self._calculate_translation_batch_size(len(untranslated))
+        batches = self._split_into_batches(untranslated, batch_size)
 
-        all_translations = {}
         for i, batch in enumerate(batches):
             logger.info(
                 f"Translating batch {i + 1}/{len(batches)} ({len(batch)} entities)"
@@ -823,15 +870,17 @@ Respond ONLY as JSON (no explanation):
 
         self._ensure_llm()
 
-        # If entities already have translations from validation, use them
-        if all(e.translation for e in entities):
+        # Entities already translated during validation are reused as-is
+        all_translations, untranslated = self._split_by_translation(entities)
+        if not untranslated:
             logger.info("Using translations from LLM validation")
-            return {e.text: e.translation for e in entities}, 0
+            return all_translations, 0
 
-        batch_size = self._calculate_translation_batch_size(len(entities))
-        batches = self._split_into_batches(entities, batch_size)
+        batch_size = self._calculate_translation_batch_size(len(untranslated))
+        batches = self._split_into_batches(untranslated, batch_size)
 
-        all_translations = {}
+        pending_ids = self._get_pending_ids_by_text(work_id, volume_id, "validated")
+        self._mark_reused_translations(pending_ids, all_translations)
         for i, batch in enumerate(batches):
             logger.info(
                 f"Translating batch {i + 1}/{len(batches)} ({len(batch)} entities)"
@@ -840,13 +889,7 @@ Respond ONLY as JSON (no explanation):
             all_translations.update(batch_translations)
 
             # Update progress after each batch
-            batch_entity_texts = list(batch_translations.keys())
-            pending = self._progress_repo.get_pending_for_phase(
-                work_id, volume_id, "validated"
-            )
-            matching_ids = [
-                p.id for p in pending if p.entity_text in batch_entity_texts
-            ]
+            matching_ids = self._take_pending_ids(pending_ids, batch_translations)
             if matching_ids:
                 self._progress_repo.batch_update_phase(
                     matching_ids, "translated", i + 1
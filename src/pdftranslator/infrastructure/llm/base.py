@@ -2,6 +2,8 @@
 
 from abc import ABC, abstractmethod
 
+from langchain_text_splitters import NLTKTextSplitter
+
 from pdftranslator.core.config.settings import Settings
 from pdftranslator.core.config.llm import BCP47Language
 
@@ -22,6 +24,31 @@ class BaseLLM(ABC):
             settings: Application settings containing LLM configuration.
         """
         self._settings = settings
+        self._text_splitters: dict[tuple[int, str], NLTKTextSplitter] = {}
+
+    def _get_text_splitter(
+        self, chunk_size: int, language: BCP47Language
+    ) -> NLTKTextSplitter:
+        """
+        Return a token-counting sentence splitter, built once per chunk size
+        and language and reused for every later text.
+        """
+        key = (chunk_size, language.to_nltk_name())
+        splitter = self._text_splitters.get(key)
+        if splitter is None:
+            splitter = self._text_splitters[key] = NLTKTextSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=0,
+                language=key[1],
+                length_function=self.count_tokens,
+            )
+        return splitter
+
+    def _load_prompt_template(self) -> str:
+        """Load translation prompt template from configured path."""
+        prompt_path = self._settings.paths.translation_prompt_path
+        with open(prompt_path, "r", encoding="utf-8") as f:
+            return f.read()
 
     @abstractmethod
     def call_model(self, prompt: str) -> str:
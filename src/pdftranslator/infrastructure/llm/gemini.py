@@ -11,7 +11,6 @@ from google.api_core import exceptions as google_exceptions
 from langchain_core.rate_limiters import InMemoryRateLimiter
 from langchain_core.runnables import Runnable
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_text_splitters import NLTKTextSplitter
 
 from pdftranslator.core.config.settings import Settings
 from pdftranslator.core.config.llm import BCP47Language
@@ -131,11 +130,8 @@ class GeminiLLM(BaseLLM):
         target_lang: str = "es",
     ) -> list[str]:
         """Split text into chunks for translation."""
-        text_splitter = NLTKTextSplitter(
-            chunk_size=self._settings.llm.gemini.context_size,
-            chunk_overlap=0,
-            language=language.to_nltk_name(),
-            length_function=self.count_tokens,
+        text_splitter = self._get_text_splitter(
+            self._settings.llm.gemini.context_size, language
         )
         return text_splitter.split_text(text)
 
@@ -172,7 +168,6 @@ class GeminiLLM(BaseLLM):
             temperature=config.temperature,
             top_p=config.top_p,
             rate_limiter=rate_limiter,
-            verbose=True,
             request_timeout=config.request_timeout or DEFAULT_TIMEOUT,
         )
 
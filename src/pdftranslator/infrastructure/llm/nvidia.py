@@ -5,7 +5,6 @@ from pathlib import Path
 
 from langchain_core.rate_limiters import InMemoryRateLimiter
 from langchain_nvidia_ai_endpoints import ChatNVIDIA
-from langchain_text_splitters import NLTKTextSplitter
 from transformers import AutoTokenizer
 
 from pdftranslator.core.config.settings import Settings
@@ -56,7 +55,6 @@ class NvidiaLLM(BaseLLM):
             max_tokens=config.max_output_tokens,
             rate_limiter=rate_limiter,
             model_kwargs={"request_timeout": timeout},
-            verbose=True,
         )
 
         logger.info(f"NvidiaLLM initialized with model: {config.model_name}")
@@ -102,7 +100,8 @@ class NvidiaLLM(BaseLLM):
         template = self._load_prompt_template()
 
         # Calculate optimal chunk size using TokenChunkCalculator
-        calculator = TokenChunkCalculator(self, self._settings.llm.nvidia)
+        config = self._settings.llm.nvidia
+        calculator = TokenChunkCalculator(self, config, config.expansion_ratios)
         prompt_tokens = calculator.measure_prompt_tokens(
             template, source_lang, target_lang
         )
@@ -115,22 +114,11 @@ class NvidiaLLM(BaseLLM):
             f"chunk_size={chunk_size} tokens"
         )
 
-        # Use NLTKTextSplitter with calculated chunk size
-        text_splitter = NLTKTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=0,
-            language=language.to_nltk_name(),
-            length_function=self.count_tokens,
-        )
+        # Reuse the cached sentence splitter for the calculated chunk size
+        text_splitter = self._get_text_splitter(chunk_size, language)
 
         return text_splitter.split_text(text)
 
-    def _load_prompt_template(self) -> str:
-        """Load translation prompt template from configured path."""
-        prompt_path = self._settings.paths.translation_prompt_path
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            return f.read()
-
     def _load_tokenizer(self, config) -> AutoTokenizer:
         """
         Load or download tokenizer.
@@ -1,20 +1,27 @@
 """Ollama local LLM implementation."""
 
 import logging
+import threading
 from pathlib import Path
 
 from langchain_ollama import ChatOllama
-from langchain_text_splitters import NLTKTextSplitter
+from ollama import Client
 from transformers import AutoTokenizer
 
 from pdftranslator.core.config.settings import Settings
 from pdftranslator.core.config.llm import BCP47Language
 from pdftranslator.infrastructure.llm.base import BaseLLM
+from pdftranslator.infrastructure.llm.token_chunk_calculator import (
+    TokenChunkCalculator,
+)
 
 logger = logging.getLogger(__name__)
 
 # Default timeout for LLM calls (1 hour in seconds)
 DEFAULT_TIMEOUT = 3600
+# Upper bound for the background warm-up request; an unreachable or stalled
+# server only costs a warning instead of a blocked startup
+PRELOAD_TIMEOUT = 60
 
 
 class OllamaLLM(BaseLLM):
@@ -31,19 +38,53 @@ class OllamaLLM(BaseLLM):
 
         config = settings.llm.ollama
         self._tokenizer = self._load_tokenizer(config)
+        self._chunk_sizes: dict[tuple[str, str], int] = {}
+        self._chunk_calculator = TokenChunkCalculator(
+            self, config, config.expansion_ratios
+        )
 
         self._model = ChatOllama(
             model=config.model_name,
             validate_model_on_init=config.validate_model,
             temperature=config.temperature,
             top_p=config.top_p,
+            # Without num_ctx the server falls back to its own default window
+            # and silently truncates prompts sized for context_size.
+            num_ctx=config.context_size,
+            keep_alive=config.keep_alive,
             request_timeout=DEFAULT_TIMEOUT,
-            verbose=True,
             reasoning=False,
         )
 
+        if config.preload_model:
+            threading.Thread(
+                target=self._preload_model,
+                args=(config,),
+                name="ollama-preload",
+                daemon=True,
+            ).start()
+
         logger.info(f"OllamaLLM initialized with model: {config.model_name}")
 
+    def _preload_model(self, config) -> None:
+        """
+        Load the model into server memory before the first chunk is sent.
+
+        An empty-prompt generate only loads the weights, so the cold start is
+        paid here once instead of inside the first translation call. A no-op
+        when the model is already resident. Runs fire-and-forget on a daemon
+        thread with its own short timeout.
+        """
+        try:
+            Client(timeout=PRELOAD_TIMEOUT).generate(
+                model=config.model_name, prompt="", keep_alive=config.keep_alive
+            )
+            logger.info(f"Ollama model '{config.model_name}' preloaded")
+        except Exception as e:
+            logger.warning(
+                f"Could not preload Ollama model '{config.model_name}': {e}"
+            )
+
     def call_model(self, prompt: str) -> str:
         """Call the Ollama model with a prompt."""
         response = self._model.invoke(prompt)
@@ -70,14 +111,38 @@ class OllamaLLM(BaseLLM):
         target_lang: str = "es",
     ) -> list[str]:
         """Split text into chunks for translation."""
-        text_splitter = NLTKTextSplitter(
-            chunk_size=self._settings.llm.ollama.context_size,
-            chunk_overlap=0,
-            language=language.to_nltk_name(),
-            length_function=self.count_tokens,
+        text_splitter = self._get_text_splitter(
+            self._get_chunk_size(source_lang, target_lang), language
         )
         return text_splitter.split_text(text)
 
+    def _get_chunk_size(self, source_lang: str, target_lang: str) -> int:
+        """
+        Token budget for one chunk, cached per language pair.
+
+        The prompt overhead is measured once, and what is left of the context
+        window is shared between the chunk and its translation, which is
+        expected to be expansion_ratio times longer.
+        """
+        key = (source_lang.lower(), target_lang.lower())
+        chunk_size = self._chunk_sizes.get(key)
+        if chunk_size is None:
+            calculator = self._chunk_calculator
+            prompt_tokens = calculator.measure_prompt_tokens(
+                self._load_prompt_template(), source_lang, target_lang
+            )
+            expansion_ratio = calculator.get_expansion_ratio(source_lang, target_lang)
+            chunk_size = calculator.calculate_shared_context_chunk_size(
+                prompt_tokens, expansion_ratio
+            )
+            self._chunk_sizes[key] = chunk_size
+            logger.info(
+                f"Ollama chunking: prompt={prompt_tokens} tokens, "
+                f"expansion={expansion_ratio:.2f} ({source_lang}->{target_lang}), "
+                f"chunk_size={chunk_size} tokens"
+            )
+        return chunk_size
+
     def _load_tokenizer(self, config) -> AutoTokenizer:
         """
         Load or download tokenizer.
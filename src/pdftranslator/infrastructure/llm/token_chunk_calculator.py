@@ -3,7 +3,7 @@
 import logging
 from typing import ClassVar
 
-from pdftranslator.core.config.llm import NvidiaConfig
+from pdftranslator.core.config.llm import NvidiaConfig, OllamaConfig
 from pdftranslator.infrastructure.llm.protocol import LLMClient
 
 logger = logging.getLogger(__name__)
@@ -49,7 +49,7 @@ class TokenChunkCalculator:
     def __init__(
         self,
         llm_client: LLMClient,
-        config: NvidiaConfig,
+        config: NvidiaConfig | OllamaConfig,
         custom_ratios: dict[str, float] | None = None,
     ):
         """
@@ -57,7 +57,7 @@ class TokenChunkCalculator:
 
         Args:
             llm_client: LLM client for token counting.
-            config: NVIDIA configuration with chunking parameters.
+            config: NVIDIA or Ollama configuration with chunking parameters.
             custom_ratios: Optional override for expansion ratios (key: "src-tgt").
         """
         self._llm = llm_client
@@ -181,6 +181,47 @@ class TokenChunkCalculator:
 
         return chunk_size
 
+    def calculate_shared_context_chunk_size(
+        self,
+        prompt_tokens: int,
+        expansion_ratio: float,
+    ) -> int:
+        """
+        Calculate chunk size when prompt, chunk and output share one window.
+
+        Used for servers such as Ollama that have no separate output budget.
+
+        Formula:
+            available = context_size - prompt_tokens
+            chunk_size = available / (1 + expansion_ratio) * (1 - safety_margin)
+            return max(chunk_size, min_chunk_tokens)
+
+        Args:
+            prompt_tokens: Measured token count of formatted prompt.
+            expansion_ratio: Output/input token ratio for language pair.
+
+        Returns:
+            Optimal chunk size in tokens.
+        """
+        cfg = self._config
+        margin = 1.0 - cfg.chunk_safety_margin_pct
+
+        available_context = max(0, cfg.context_size - prompt_tokens)
+        chunk_size = available_context / (1 + expansion_ratio) * margin
+        chunk_size = max(round(chunk_size), cfg.min_chunk_tokens)
+
+        logger.info(
+            "Shared-context chunk calculation: prompt=%s, expansion=%.2f, "
+            "context=%s, min_chunk=%s -> %s",
+            prompt_tokens,
+            expansion_ratio,
+            cfg.context_size,
+            cfg.min_chunk_tokens,
+            chunk_size,
+        )
+
+        return chunk_size
+
     def validate_response_not_truncated(self, response: str, max_output: int) -> bool:
         """
         Heuristic check for response truncation.
@@ -1,6 +1,7 @@
 """Shared translation orchestration with progress callbacks."""
 
 import logging
+import time
 from dataclasses import dataclass
 from typing import Callable, Optional
 
@@ -15,6 +16,10 @@ from pdftranslator.database.repositories.volume_repository import VolumeReposito
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between job writes while already translated chapters are
+# skipped; a resumed book otherwise commits one UPDATE per skipped chapter.
+SKIPPED_PROGRESS_PERSIST_INTERVAL = 1.0
+
 
 @dataclass
 class TranslationProgress:
@@ -261,7 +266,10 @@ class TranslationOrchestrator:
         job.status = "in_progress"
         self._job_repo.update(job)
 
+        last_persisted = 0.0
+
         def on_progress(progress: TranslationProgress) -> None:
+            nonlocal last_persisted
             job.current_chapter_info = progress.current_chapter
             if progress.chapter_status == "success":
                 job.success_count += 1
@@ -271,7 +279,13 @@ class TranslationOrchestrator:
                 job.completed_chapters += 1
             elif progress.chapter_status == "skipped":
                 job.completed_chapters += 1
+                if (
+                    time.monotonic() - last_persisted
+                    < SKIPPED_PROGRESS_PERSIST_INTERVAL
+                ):
+                    return
             self._job_repo.update(job)
+            last_persisted = time.monotonic()
 
         try:
             if job.scope == "all_book":
@@ -339,6 +353,6 @@ class TranslationOrchestrator:
         volumes = self._volume_repo.get_by_work_id(work_id)
         total = 0
         for v in volumes:
-            chapters = self._chapter_repo.get_by_volume(v.id)
-            total += len(chapters)
+            volume_total, _ = self._chapter_repo.count_by_volume(v.id)
+            total += volume_total
         return total
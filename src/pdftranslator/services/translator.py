@@ -1,12 +1,16 @@
 """Translator service with dependency injection."""
 
+import asyncio
 import logging
-import re
 from dataclasses import dataclass, field
 from typing import List
 
 from pdftranslator.core.config.llm import BCP47Language
 from pdftranslator.core.config.settings import Settings
+from pdftranslator.core.text_patterns import (
+    TRIPLE_NEWLINE_PATTERN,
+    UNTRANSLATABLE_CHUNK_PATTERN,
+)
 from pdftranslator.infrastructure.llm.factory import LLMFactory
 from pdftranslator.infrastructure.llm.protocol import LLMClient
 
@@ -58,6 +62,7 @@ class TranslatorService:
         self._llm_factory = llm_factory
         self._settings = settings or Settings.get()
         self._llm_client: LLMClient = llm_factory.create()
+        self._max_concurrency = self._settings.processing.translation_concurrency
         self._progress = None
 
     def set_progress(self, progress) -> None:
@@ -102,26 +107,52 @@ class TranslatorService:
         # Load prompt template
         prompt_template = self._load_prompt_template()
 
-        # Translate chunks
-        translated_parts = []
+        translated_parts: List[str] = [""] * len(chunks)
         errors = []
+        # Repeated chunks (headers, scene breaks, boilerplate) hit the model once
+        positions_by_chunk: dict[str, list[int]] = {}
+        skipped = 0
+
+        for i, chunk in enumerate(chunks):
+            stripped = chunk.strip()
+            if UNTRANSLATABLE_CHUNK_PATTERN.fullmatch(stripped):
+                translated_parts[i] = stripped
+                skipped += 1
+            elif stripped in positions_by_chunk:
+                positions_by_chunk[stripped].append(i)
+                skipped += 1
+            else:
+                positions_by_chunk[stripped] = [i]
+
+        pending = [
+            (positions[0], chunks[positions[0]])
+            for positions in positions_by_chunk.values()
+        ]
+        outcomes = asyncio.run(
+            self._translate_pending(pending, prompt_template, source_lang, target_lang)
+        )
 
-        iterator = self._get_iterator(chunks)
-
-        for i, chunk in iterator:
-            try:
-                result = self._translate_chunk(
-                    chunk, i, prompt_template, source_lang, target_lang
-                )
-                translated_parts.append(result)
-            except Exception as e:
-                logger.error(f"Error translating chunk {i + 1}: {e}")
-                errors.append(f"Chunk {i + 1}: {str(e)}")
-                translated_parts.append(self._ERROR_CHUNK_MARKER.format(index=i + 1))
+        for positions, outcome in zip(
+            positions_by_chunk.values(), outcomes, strict=True
+        ):
+            if isinstance(outcome, Exception):
+                i = positions[0]
+                logger.error(f"Error translating chunk {i + 1}: {outcome}")
+                errors.append(f"Chunk {i + 1}: {str(outcome)}")
+                for position in positions:
+                    translated_parts[position] = self._ERROR_CHUNK_MARKER.format(
+                        index=position + 1
+                    )
+                continue
+            for position in positions:
+                translated_parts[position] = outcome
+
+        if skipped:
+            logger.info(f"Skipped LLM call for {skipped} trivial or repeated chunks")
 
         # Combine translated parts
         full_text = "\n\n".join(translated_parts)
-        full_text = re.sub(r"\n{3,}", "\n\n", full_text).strip()
+        full_text = TRIPLE_NEWLINE_PATTERN.sub("\n\n", full_text).strip()
 
         return TranslationResult(
             original_chunks=len(chunks),
@@ -157,8 +188,44 @@ class TranslatorService:
 
         return self._llm_client.call_model(prompt)
 
-    def _get_iterator(self, chunks: List[str]):
-        """Get iterator for chunk processing."""
+    async def _translate_pending(
+        self,
+        pending: List[tuple[int, str]],
+        template: str,
+        source_lang: str,
+        target_lang: str,
+    ) -> List[str | Exception]:
+        """
+        Translate chunks concurrently, keeping at most max_concurrency in flight.
+
+        Returns one entry per pending chunk, in order: the translation, or the
+        exception raised while translating it.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def translate_one(index: int, chunk: str) -> str | Exception:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        self._translate_chunk,
+                        chunk,
+                        index,
+                        template,
+                        source_lang,
+                        target_lang,
+                    )
+                except Exception as e:
+                    return e
+
+        tasks = [
+            asyncio.ensure_future(translate_one(index, chunk))
+            for index, chunk in pending
+        ]
         if self._progress:
-            return self._progress(enumerate(chunks), desc="Translating Chunks...")
-        return enumerate(chunks)
+            for task in self._progress(
+                asyncio.as_completed(tasks),
+                desc="Translating Chunks...",
+                total=len(tasks),
+            ):
+                await task
+        return await asyncio.gather(*tasks)
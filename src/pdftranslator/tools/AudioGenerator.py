@@ -1,7 +1,9 @@
 import logging
+import os
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.error import HTTPError, URLError
 
@@ -15,6 +17,10 @@ from pdftranslator.tools.OverlapCleaner import clean_overlap
 # Configure logging for this module
 logger = logging.getLogger(__name__)
 
+# Each chunk is synthesized by its own 'say' process, so the worker threads only
+# wait on subprocesses and one worker per core keeps every core busy.
+_SYNTHESIS_WORKERS = os.cpu_count() or 1
+
 # Module-level flag and helper function to ensure NLTK 'punkt' is downloaded only once
 _NLTK_PUNKT_DOWNLOADED = False
 
@@ -65,7 +71,7 @@ class AudioGenerator:
         "<br>": "\n",
     }
 
-    def __init__(self, progress=None):
+    def __init__(self, progress=None, max_workers=None):
         if not shutil.which("say"):
             raise RuntimeError("The 'say' command is not available on this system.")
 
@@ -79,6 +85,8 @@ class AudioGenerator:
             chunk_size=500, chunk_overlap=0, language="spanish"
         )
         self._progress = progress
+        # Callers running several generators at once pass a share of the cores
+        self._max_workers = max_workers or _SYNTHESIS_WORKERS
 
     def _normalize_text_chunk(self, text_chunk: str) -> str:
         """Normalizes a text chunk by replacing typographic characters and HTML breaks."""
@@ -102,12 +110,9 @@ class AudioGenerator:
             )
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        temp_text_file = self.output_dir / f"{output_audio_file.stem}_text.txt"
         try:
-            with open(temp_text_file, "w", encoding="utf-8") as f:
-                f.write(text_chunk)
-
-            # Using -f to read from file can be more robust for special characters
+            # "-f -" reads the text from stdin: no temp file written and read
+            # back per chunk, and special characters never pass through argv
             subprocess.run(
                 [
                     "say",
@@ -116,8 +121,9 @@ class AudioGenerator:
                     "-o",
                     str(output_audio_file),
                     "-f",
-                    str(temp_text_file),
+                    "-",
                 ],
+                input=text_chunk,
                 check=True,
                 capture_output=True,
                 text=True,  # Capture output for logging
@@ -134,14 +140,10 @@ class AudioGenerator:
                 exc_info=True,
             )
             raise
-        finally:
-            # Clean up the temporary text file immediately if it exists
-            if temp_text_file.exists():
-                temp_text_file.unlink()
 
     def _merge_audio_files(self, audio_files: list[Path], target_file: Path):
         """
-        Merges multiple .m4a audio files into one using ffmpeg.
+        Merges multiple audio chunk files into one .m4a file using ffmpeg.
 
         Parameters:
         - audio_files (list[Path]): List of audio file Paths to merge.
@@ -162,10 +164,10 @@ class AudioGenerator:
             # -y: overwrite output files without asking
             # -f concat: use the concat demuxer
             # -safe 0: necessary if using absolute paths in the list file
-            # -af volume=0.3dB: apply audio gain
-            # -ac 2: stereo audio
-            # -c:a libmp3lame: use MP3 encoder
-            # -b:a 64k: audio bitrate for stereo voice
+            # -filter_complex: loudness/dynamics/band-limit chain for speech
+            # -ac 1: mono output, 'say' voices are mono so no channel mapping
+            # -c:a libfdk_aac -profile:a aac_he: HE-AAC, suited to low-bitrate voice
+            # -b:a 48k: audio bitrate for mono voice
             # -ar 24000: sample rate
             subprocess.run(
                 [
@@ -178,7 +180,7 @@ class AudioGenerator:
                     "-i",
                     str(file_list_path),
                     "-filter_complex",
-                    "[0:a]loudnorm=I=-16:LRA=11:TP=-1.5,compand=attacks=0.02:decays=0.1:points=-80/-80|-30/-10|-20/-8|0/0,highpass=f=80,lowpass=f=12000,aresample=24000,pan=stereo|c0=c0|c1=c0[a]",
+                    "[0:a]loudnorm=I=-16:LRA=11:TP=-1.5,compand=attacks=0.02:decays=0.1:points=-80/-80|-30/-10|-20/-8|0/0,highpass=f=80,lowpass=f=12000,aresample=24000[a]",
                     "-map",
                     "[a]",
                     "-ac",
@@ -186,14 +188,12 @@ class AudioGenerator:
                     "-c:a",
                     "libfdk_aac",  # aac codec
                     "-b:a",
-                    "48k",  # Bitrate for stereo
+                    "48k",
                     "-ar",
                     "24000",
                     "-profile:a",
                     "aac_he",
                     "-vn",
-                    "-compression_level",
-                    "12",
                     "-cutoff",
                     "12000",
                     "-movflags",
@@ -218,7 +218,7 @@ class AudioGenerator:
 
     def process_texts(self, text_content: str, output_filename: Path) -> bool:
         """
-        Converts a large text content to individual .m4a audio files for chunks
+        Converts a large text content to individual .aiff audio files for chunks
         and merges them into one final .m4a file.
         Uses a temporary directory for intermediate files, which is cleaned up afterwards.
 
@@ -262,7 +262,7 @@ class AudioGenerator:
             if not cleaned.__eq__(next_chunk):
                 print(f"Cleaned chunk: {cleaned}")
 
-        audio_files_generated = []
+        generated_chunks: list[tuple[int, Path]] = []
 
         try:
             with tempfile.TemporaryDirectory(prefix="audio_chunks_") as temp_dir_str:
@@ -271,26 +271,47 @@ class AudioGenerator:
                     f"Using temporary directory for audio chunks: {self.output_dir}"
                 )
 
-                if self._progress:
-                    iterator = self._progress(
-                        enumerate(chunks), desc="Generating Audio Chunks", unit="chunk"
-                    )
-                else:
-                    iterator = tqdm(
-                        enumerate(chunks, start=1),
-                        total=len(chunks),
-                        desc="Generating Audio Chunks",
-                        unit="chunk",
-                    )
-
-                for i, chunk_text in iterator:
-                    normalized_chunk = self._normalize_text_chunk(chunk_text)
-                    chunk_audio_file = self.output_dir / f"chunk_{i:04d}.m4a"
-                    try:
-                        self._text_to_audio(normalized_chunk, chunk_audio_file)
-                        audio_files_generated.append(chunk_audio_file)
-                    except Exception as e:
-                        logger.error(f"Failed to generate audio for chunk {i}: {e}")
+                with ThreadPoolExecutor(
+                    max_workers=min(self._max_workers, len(chunks))
+                ) as executor:
+                    futures = {}
+                    for i, chunk_text in enumerate(chunks, start=1):
+                        normalized_chunk = self._normalize_text_chunk(chunk_text)
+                        # Uncompressed AIFF intermediates: ffmpeg encodes AAC once,
+                        # at merge time, instead of decoding a lossy AAC per chunk.
+                        chunk_audio_file = self.output_dir / f"chunk_{i:04d}.aiff"
+                        future = executor.submit(
+                            self._text_to_audio, normalized_chunk, chunk_audio_file
+                        )
+                        futures[future] = (i, chunk_audio_file)
+
+                    if self._progress:
+                        iterator = self._progress(
+                            as_completed(futures),
+                            desc="Generating Audio Chunks",
+                            unit="chunk",
+                        )
+                    else:
+                        iterator = tqdm(
+                            as_completed(futures),
+                            total=len(futures),
+                            desc="Generating Audio Chunks",
+                            unit="chunk",
+                        )
+
+                    for future in iterator:
+                        i, chunk_audio_file = futures[future]
+                        try:
+                            future.result()
+                            generated_chunks.append((i, chunk_audio_file))
+                        except Exception as e:
+                            logger.error(f"Failed to generate audio for chunk {i}: {e}")
+
+                # Chunks finish out of order; sort by index, not by file name,
+                # which would put chunk_10000 before chunk_2000.
+                audio_files_generated = [
+                    path for _, path in sorted(generated_chunks)
+                ]
 
                 if not audio_files_generated:
                     logger.warning(
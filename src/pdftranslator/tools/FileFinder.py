@@ -1,7 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -71,11 +71,20 @@ class FileFinder:
             raise NotADirectoryError(
                 f"Source path is not a directory: {self.input_dir}"
             )
+        # rglob results per extension, so repeated searches skip the tree walk
+        self._candidates: Dict[str, List[Path]] = {}
+
+    def refresh(self) -> None:
+        """Forget cached directory scans so the next search walks the tree again."""
+        self._candidates.clear()
 
     def get_files(self, file_type: str, filters: List[FileFilter]) -> List[Path]:
         """
         Searches for files recursively, applying a list of filters.
 
+        The directory scan is cached per file type; call refresh() to pick up
+        files created since the first search.
+
         Args:
             file_type: The extension of the files to search for (e.g., "pdf").
             filters: A list of FileFilter objects to apply.
@@ -85,8 +94,12 @@ class FileFinder:
         """
         logger.info(f"Searching for *.{file_type} files in: {self.input_dir}")
 
-        # Use rglob to find all files with the given extension.
-        candidate_paths = self.input_dir.rglob(f"*.{file_type}")
+        # Use rglob to find all files with the given extension, once per type.
+        candidate_paths = self._candidates.get(file_type)
+        if candidate_paths is None:
+            candidate_paths = self._candidates[file_type] = list(
+                self.input_dir.rglob(f"*.{file_type}")
+            )
 
         # Apply all filters to each path.
         # The class now depends on the FileFilter abstraction, not concrete filters.
@@ -1,13 +1,28 @@
 import logging
+import multiprocessing
+import os
+import posixpath
 import re
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional, Dict, Callable, List, Tuple, Set
+from typing import Optional, Dict, Callable, Iterator, List, Tuple, Set
+from urllib.parse import unquote
+from xml.etree import ElementTree
 
-import ebooklib
 import fitz  # PyMuPDF
 from bs4 import BeautifulSoup
-from ebooklib import epub
+
+from pdftranslator.core.text_patterns import TRIPLE_NEWLINE_PATTERN
+
+try:
+    # Parsing, tag removal and the text walk all run in C; BeautifulSoup is
+    # only used when lxml is not installed.
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    etree = lxml_html = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -15,6 +30,166 @@ logger = logging.getLogger(__name__)
 # Define constants for better readability and maintainability
 PDF_EXTENSION = ".pdf"
 EPUB_EXTENSION = ".epub"
+# PyMuPDF is not thread-safe and HTML parsing holds the GIL,
+# so large documents are spread across worker processes. Below these sizes
+# the cost of starting a process outweighs the speedup.
+MIN_PDF_PAGES_PER_WORKER = 32
+MIN_EPUB_ITEMS_PER_WORKER = 8
+DEFAULT_EXTRACTION_WORKERS = min(os.cpu_count() or 1, 4)
+# Workers are spawned, never forked: the caller may already run other threads
+# (the audio worker in `process`, uvicorn's pool), and forking those can deadlock
+_WORKER_CONTEXT = multiprocessing.get_context("spawn")
+# EPUB documents are read straight from the zip, one at a time, in batches
+EPUB_DOCUMENTS_PER_BATCH = 4
+EPUB_CONTAINER_PATH = "META-INF/container.xml"
+EPUB_DOCUMENT_MEDIA_TYPE = "application/xhtml+xml"
+_EPUB_NAMESPACES = {
+    "container": "urn:oasis:names:tc:opendocument:xmlns:container",
+    "opf": "http://www.idpf.org/2007/opf",
+}
+# Plain-text extraction flags: ligatures (ﬁ, ﬂ) are expanded to ordinary
+# letters so the translation tokenizer and glossary matching see real words
+PDF_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+
+# Artifacts removed from extracted text, compiled once and applied in order
+_ARTIFACT_PATTERNS: Tuple[re.Pattern, ...] = (
+    # URLs (http/https links)
+    re.compile(r"https?://\S+", re.IGNORECASE),
+    # URLs without http/https prefix (e.g., www.example.com, example.com/path).
+    # Word boundaries around common domain patterns avoid removing legitimate words.
+    re.compile(
+        r"\b(?:www\.)?[\w.-]+\.(?:com|org|net|gov|edu|io|co|ai|app|blog|info|biz|dev|me|xyz)(?:\/\S*)?\b",
+        re.IGNORECASE,
+    ),
+    # Social media mentions (@username)
+    re.compile(r"@\w+"),
+    # Hashtags (#hashtag)
+    re.compile(r"#\w+"),
+    # Common social media platform names (case-insensitive)
+    re.compile(
+        r"\b(?:Twitter|Facebook|Instagram|LinkedIn|YouTube|Reddit|Pinterest|TikTok|Snapchat|WhatsApp|Telegram|Discord|WeChat|Signal)\b",
+        re.IGNORECASE,
+    ),
+    # ISBN numbers (e.g., ISBN 978-1234567890, ISBN-13: 978-1-234-56789-0)
+    re.compile(r"ISBN(?:\s*-?\s*\d{1,5}){2,5}[xX]?", re.IGNORECASE),
+    # The plural form "ISBNs"
+    re.compile(r"\bISBNs\b", re.IGNORECASE),
+    # "Page X" or "P. X" style numbering, case-insensitively
+    re.compile(r"(?i)(?:^|\s)(?:page|p\.)\s*\d+\s*(?:de\s*\d+)?(?:/|\s|$)"),
+    # Page numbers in "page|X" format (e.g., page|1, Page|123)
+    re.compile(r"(?i)(?:^|\s)page\|\s*\d+"),
+    # Lines that likely are just page numbers (only digits and whitespace)
+    re.compile(r"^\s*\d+\s*$", re.MULTILINE),
+    # Header/footer-like patterns (repeating book titles, chapter names) are
+    # too context-dependent for regex; the LLM prompt handles those.
+)
+_BLANK_LINES_PATTERN = re.compile(r"(\n\s*)+\n")
+_SECTION_BLANK_LINES_PATTERN = re.compile(r"(\s*\n\s*){2,}")
+
+
+def _extract_pages(doc: fitz.Document, start: int, stop: int) -> List[str]:
+    """Returns the non-empty text of pages [start, stop) of an open document."""
+    pages: List[str] = []
+    for page_index in range(start, stop):
+        try:
+            # Edges are trimmed once on the joined text by _clean_extracted_text
+            page_text = doc[page_index].get_text("text", flags=PDF_TEXT_FLAGS)
+            if page_text and not page_text.isspace():
+                pages.append(page_text)
+        except Exception as e:
+            logger.warning(
+                f"  - PDF: Could not extract text from page {page_index + 1}: {e}"
+            )
+    return pages
+
+
+def _extract_pdf_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Worker process entry point: opens the PDF and extracts a page range."""
+    with fitz.open(pdf_path) as doc:
+        return _extract_pages(doc, start, stop)
+
+
+def _lxml_body_text(content: bytes, html_tags_to_remove: List[str]) -> str:
+    """Newline-joined stripped text nodes of <body>, like get_text(strip=True)."""
+    if not content.strip():
+        return ""
+    root = lxml_html.document_fromstring(content)
+    body = root.find("body")
+    if body is None:
+        body = root
+    # with_tail=False keeps the text that follows a removed element
+    etree.strip_elements(body, etree.Comment, *html_tags_to_remove, with_tail=False)
+    return "\n".join(
+        stripped for text in body.itertext() if (stripped := text.strip())
+    )
+
+
+def _process_epub_item(
+    item_name: str, content: bytes, html_tags_to_remove: List[str]
+) -> str:
+    """Returns the cleaned text of one EPUB document, or "" on failure."""
+    try:
+        if lxml_html is not None:
+            raw_text = _lxml_body_text(content, html_tags_to_remove)
+        else:
+            soup = BeautifulSoup(content, "html.parser")
+            body = soup.body or soup
+            for tag in html_tags_to_remove:
+                for element in body.find_all(tag):
+                    element.decompose()
+
+            raw_text = body.get_text(separator="\n", strip=True)
+        # Clean up whitespace within the section before appending
+        return _SECTION_BLANK_LINES_PATTERN.sub("\n\n", raw_text).strip()
+    except Exception as e:
+        logger.warning(f"  - EPUB: Could not process item '{item_name}': {e}")
+        return ""
+
+
+def _list_epub_documents(archive: zipfile.ZipFile) -> List[str]:
+    """Returns the archive paths of the XHTML documents, in manifest order."""
+    container = ElementTree.fromstring(archive.read(EPUB_CONTAINER_PATH))
+    rootfile = container.find(".//container:rootfile", _EPUB_NAMESPACES)
+    if rootfile is None or not rootfile.get("full-path"):
+        raise ValueError("EPUB container.xml does not reference a package file")
+
+    opf_path = rootfile.get("full-path")
+    package = ElementTree.fromstring(archive.read(opf_path))
+    opf_dir = posixpath.dirname(opf_path)
+    return [
+        posixpath.normpath(posixpath.join(opf_dir, unquote(item.get("href", ""))))
+        for item in package.iterfind("opf:manifest/opf:item", _EPUB_NAMESPACES)
+        if item.get("media-type") == EPUB_DOCUMENT_MEDIA_TYPE
+    ]
+
+
+def _iter_epub_documents(
+    archive: zipfile.ZipFile, names: List[str], html_tags_to_remove: List[str]
+) -> Iterator[str]:
+    """Reads and cleans EPUB documents one at a time from an open archive."""
+    for name in names:
+        try:
+            content = archive.read(name)
+        except KeyError:
+            logger.warning(f"  - EPUB: Item '{name}' is listed but missing.")
+            yield ""
+            continue
+        yield _process_epub_item(name, content, html_tags_to_remove)
+
+
+def _process_epub_documents(
+    archive: zipfile.ZipFile, names: List[str], html_tags_to_remove: List[str]
+) -> List[str]:
+    """Cleans a batch of EPUB documents; results must be picklable for workers."""
+    return list(_iter_epub_documents(archive, names, html_tags_to_remove))
+
+
+def _extract_epub_documents(
+    epub_path: str, names: List[str], html_tags_to_remove: List[str]
+) -> List[str]:
+    """Worker process entry point: opens the EPUB and cleans a batch of documents."""
+    with zipfile.ZipFile(epub_path) as archive:
+        return _process_epub_documents(archive, names, html_tags_to_remove)
 
 
 class TextExtractor:
@@ -22,14 +197,22 @@ class TextExtractor:
     Extracts and cleans text from PDF and EPUB files.
     """
 
-    def __init__(self, html_tags_to_remove: Optional[List[str]] = None):
+    def __init__(
+        self,
+        html_tags_to_remove: Optional[List[str]] = None,
+        max_workers: int = 1,
+    ):
         """
         Initializes the text extractor.
 
         Args:
             html_tags_to_remove: A list of HTML tags to be removed from the content of EPUBs.
             If not provided, a default list will be used.
+            max_workers: Maximum number of processes used to extract a large PDF
+            or EPUB. Defaults to 1, extracting in the calling process; CLI
+            commands opt in with DEFAULT_EXTRACTION_WORKERS.
         """
+        self.max_workers = max_workers
         self._extraction_methods: Dict[str, Callable] = {
             PDF_EXTENSION: self._extract_from_pdf,
             EPUB_EXTENSION: self._extract_from_epub,
@@ -72,8 +255,8 @@ class TextExtractor:
         except FileNotFoundError as e:
             logger.error(f"File error: {e}", exc_info=True)
         except (
-            epub.EpubException,
             zipfile.BadZipFile,
+            ElementTree.ParseError,
             fitz.EmptyFileError,
             fitz.FileDataError,
         ) as e:
@@ -95,54 +278,13 @@ class TextExtractor:
         """
         logger.info("  - Cleaning extracted text...")
         cleaned_text = text
-
-        # Remove URLs (http/https links)
-        cleaned_text = re.sub(r"https?://\S+", "", cleaned_text, flags=re.IGNORECASE)
-        # Remove URLs without http/https prefix (e.g., www.example.com, example.com/path)
-        # This needs to be done carefully to avoid removing legitimate words.
-        # This regex looks for word boundaries around common domain patterns.
-        cleaned_text = re.sub(
-            r"\b(?:www\.)?[\w.-]+\.(?:com|org|net|gov|edu|io|co|ai|app|blog|info|biz|dev|me|xyz)(?:\/\S*)?\b",
-            "",
-            cleaned_text,
-            flags=re.IGNORECASE,
-        )
-        # Remove social media mentions (@username)
-        cleaned_text = re.sub(r"@\w+", "", cleaned_text)
-        # Remove hashtags (#hashtag)
-        cleaned_text = re.sub(r"#\w+", "", cleaned_text)
-        # Remove common social media platform names (case-insensitive)
-        cleaned_text = re.sub(
-            r"\b(?:Twitter|Facebook|Instagram|LinkedIn|YouTube|Reddit|Pinterest|TikTok|Snapchat|WhatsApp|Telegram|Discord|WeChat|Signal)\b",
-            "",
-            cleaned_text,
-            flags=re.IGNORECASE,
-        )
-        # Remove ISBN numbers (e.g., ISBN 978-1234567890, ISBN-13: 978-1-234-56789-0)
-        cleaned_text = re.sub(
-            r"ISBN(?:\s*-?\s*\d{1,5}){2,5}[xX]?", "", cleaned_text, flags=re.IGNORECASE
-        )
-        # Remove the plural form "ISBNs"
-        cleaned_text = re.sub(r"\bISBNs\b", "", cleaned_text, flags=re.IGNORECASE)
-        # Remove "Page X" or "P. X" style numbering, case-insensitively
-        cleaned_text = re.sub(
-            r"(?i)(?:^|\s)(?:page|p\.)\s*\d+\s*(?:de\s*\d+)?(?:/|\s|$)",
-            "",
-            cleaned_text,
-        )
-        # Remove page numbers in "page|X" format (e.g., page|1, Page|123)
-        cleaned_text = re.sub(r"(?i)(?:^|\s)page\|\s*\d+", "", cleaned_text)
-        # Remove lines that likely are just page numbers (contain only digits and whitespace)
-        cleaned_text = re.sub(r"^\s*\d+\s*$", "", cleaned_text, flags=re.MULTILINE)
-        # Remove header/footer-like patterns (e.g., repeating book titles, chapter names, etc.)
-        # This is very context-dependent and hard to do generally with regex.
-        # The LLM prompt is better suited for contextual removal of these.
-        # For now, we focus on more generic patterns.
+        for pattern in _ARTIFACT_PATTERNS:
+            cleaned_text = pattern.sub("", cleaned_text)
 
         # Normalize multiple newlines to a maximum of two, preserving paragraphs
-        cleaned_text = re.sub(r"\n{3,}", "\n\n", cleaned_text).strip()
+        cleaned_text = TRIPLE_NEWLINE_PATTERN.sub("\n\n", cleaned_text).strip()
         # Remove any empty lines that might have resulted from previous cleaning
-        cleaned_text = re.sub(r"(\n\s*)+\n", "\n\n", cleaned_text).strip()
+        cleaned_text = _BLANK_LINES_PATTERN.sub("\n\n", cleaned_text).strip()
 
         logger.info("  - Text cleaning complete.")
         return cleaned_text
@@ -151,58 +293,82 @@ class TextExtractor:
         """
         Extracts text from a PDF file.
         """
-        extracted_pages: List[str] = []
         doc = fitz.open(pdf_path)
 
         with doc:
-            logger.info(
-                f"  - PDF: Opened '{pdf_path.name}' with {doc.page_count} pages."
-            )
+            page_count = doc.page_count
+            logger.info(f"  - PDF: Opened '{pdf_path.name}' with {page_count} pages.")
             if doc.is_repaired:
                 logger.warning(f"  - PDF: Document was damaged and has been repaired.")
 
-            for page_num, page in enumerate(doc, start=1):
-                try:
-                    page_text = page.get_text().strip()
-                    if page_text:
-                        extracted_pages.append(page_text)
-                except Exception as e:
-                    logger.warning(
-                        f"  - PDF: Could not extract text from page {page_num}: {e}"
-                    )
+            workers = min(self.max_workers, page_count // MIN_PDF_PAGES_PER_WORKER)
+            if workers <= 1:
+                extracted_pages = _extract_pages(doc, 0, page_count)
+
+        if workers > 1:
+            logger.info(f"  - PDF: Extracting pages with {workers} processes.")
+            bounds = [page_count * i // workers for i in range(workers + 1)]
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=_WORKER_CONTEXT
+            ) as executor:
+                ranges = executor.map(
+                    _extract_pdf_page_range,
+                    repeat(str(pdf_path)),
+                    bounds[:-1],
+                    bounds[1:],
+                )
+                extracted_pages = [page for pages in ranges for page in pages]
 
         full_text = "\n\n".join(extracted_pages)
         cleaned_text = self._clean_extracted_text(full_text)
         return cleaned_text
 
+    def iter_epub_sections(self, epub_path: Path) -> Iterator[str]:
+        """
+        Yields the non-empty document sections of an EPUB in reading order.
+
+        Sections are produced as they are parsed, so callers never need to hold
+        the whole book in memory. Artifact cleaning is not applied here; it runs
+        on the joined text in _extract_from_epub.
+        """
+        # Documents are read from the zip as they are parsed instead of
+        # loading the whole book into memory first
+        with zipfile.ZipFile(epub_path) as archive:
+            names = _list_epub_documents(archive)
+            logger.info(
+                f"  - EPUB: Found {len(names)} document items in '{epub_path.name}'."
+            )
+
+            workers = min(self.max_workers, len(names) // MIN_EPUB_ITEMS_PER_WORKER)
+            if workers <= 1:
+                for section in _iter_epub_documents(
+                    archive, names, self.html_tags_to_remove
+                ):
+                    if section:
+                        yield section
+                return
+
+        logger.info(f"  - EPUB: Parsing items with {workers} processes.")
+        batches = [
+            names[i : i + EPUB_DOCUMENTS_PER_BATCH]
+            for i in range(0, len(names), EPUB_DOCUMENTS_PER_BATCH)
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=_WORKER_CONTEXT
+        ) as executor:
+            # map() yields batches in submission order as they complete
+            for batch in executor.map(
+                _extract_epub_documents,
+                repeat(str(epub_path)),
+                batches,
+                repeat(self.html_tags_to_remove),
+            ):
+                yield from (section for section in batch if section)
+
     def _extract_from_epub(self, epub_path: Path) -> str:
         """
         Extracts and cleans text from an EPUB file.
         """
-        text_sections: List[str] = []
-        book = epub.read_epub(epub_path)
-        items = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
-        logger.info(
-            f"  - EPUB: Found {len(items)} document items in '{epub_path.name}'."
-        )
-
-        for item in items:
-            try:
-                soup = BeautifulSoup(item.get_body_content(), "html.parser")
-                for tag in self.html_tags_to_remove:
-                    for element in soup.find_all(tag):
-                        element.decompose()
-
-                raw_text = soup.get_text(separator="\n", strip=True)
-                # Clean up whitespace within the section before appending
-                cleaned_section = re.sub(r"(\s*\n\s*){2,}", "\n\n", raw_text).strip()
-                if cleaned_section:
-                    text_sections.append(cleaned_section)
-            except Exception as e:
-                logger.warning(
-                    f"  - EPUB: Could not process item '{item.get_name()}': {e}"
-                )
-
-        full_text = "\n\n".join(text_sections)
+        full_text = "\n\n".join(self.iter_epub_sections(epub_path))
         cleaned_text = self._clean_extracted_text(full_text)
         return cleaned_text
@@ -1,8 +1,16 @@
+import asyncio
 import logging
 import re
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 
 from pdftranslator.core.config.llm import BCP47Language
 from pdftranslator.core.config.settings import Settings
+from pdftranslator.core.text_patterns import (
+    TRIPLE_NEWLINE_PATTERN,
+    UNTRANSLATABLE_CHUNK_PATTERN,
+)
 from pdftranslator.infrastructure.llm.gemini import GeminiLLM
 from pdftranslator.infrastructure.llm.nvidia import NvidiaLLM
 from pdftranslator.infrastructure.llm.ollama import OllamaLLM
@@ -11,6 +19,24 @@ from pdftranslator.infrastructure.llm.base import BaseLLM
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Source language code -> BCP47Language used for NLTK sentence splitting
+SPLIT_LANGUAGES = MappingProxyType(
+    {
+        "en": BCP47Language.ENGLISH,
+        "es": BCP47Language.SPANISH,
+        "zh": BCP47Language.CHINESE,
+        "ja": BCP47Language.JAPANESE,
+        "ko": BCP47Language.KOREAN,
+        "fr": BCP47Language.FRENCH,
+        "de": BCP47Language.GERMAN,
+        "it": BCP47Language.ITALIAN,
+        "pt": BCP47Language.PORTUGUESE,
+        "ru": BCP47Language.RUSSIAN,
+        "ar": BCP47Language.ARABIC,
+        "hi": BCP47Language.HINDI,
+    }
+)
+
 
 class Translator:
     """
@@ -19,15 +45,42 @@ class Translator:
 
     _EMPTY_CHUNK_MARKER_FORMAT = "[EMPTY_TRANSLATION_CHUNK_{index}]"
     _ERROR_CHUNK_MARKER_FORMAT = "[TRANSLATION_ERROR_CHUNK_{index}]"
+    _TEXT_CHUNK_PLACEHOLDER = "{text_chunk}"
+    # Exact-match translations kept per instance (chapter headers, scene
+    # breaks, repeated boilerplate); oldest entries are evicted first
+    _TRANSLATION_CACHE_SIZE = 4096
+    _MIN_CACHEABLE_LENGTH = 3
+    # LLM calls per chunk before it is replaced by an error marker
+    _MAX_CHUNK_ATTEMPTS = 1
+    # Bare URLs carry nothing to translate either
+    _URL_CHUNK_PATTERN = re.compile(r"(?:(?:https?://|www\.)\S+\s*)+")
+    # Our own placeholders, e.g. re-fed from a previous run's output
+    _MARKER_CHUNK_PATTERN = re.compile(
+        r"(?:\[(?:TRANSLATION_ERROR|EMPTY_TRANSLATION)_CHUNK_\d+\]\s*)+"
+    )
 
-    def __init__(self, progress=None):
+    def __init__(self, progress=None, concurrency: int | None = None):
         """
         Initializes the Translator, creating the appropriate LLM client
         based on the global configuration.
+
+        Args:
+            progress: Optional tqdm-like wrapper used to report chunk progress.
+            concurrency: Maximum LLM calls in flight at once. Defaults to
+                processing.translation_concurrency.
         """
         self._settings = Settings.get()
         self.llm_client = self._create_llm_client()
         self._progress = progress
+        self._concurrency = (
+            concurrency or self._settings.processing.translation_concurrency
+        )
+        self._prompt_template: str | None = None
+        self._prompt_parts: dict[tuple[str, str], tuple[str, str]] = {}
+        self._translation_cache: OrderedDict[tuple[str, str, str], str] = (
+            OrderedDict()
+        )
+        self._translation_cache_lock = threading.Lock()
 
     def _create_llm_client(self) -> BaseLLM:
         """Factory function to create an LLM client."""
@@ -41,62 +94,175 @@ class Translator:
         else:
             raise ValueError(f"Unsupported agent specified in config: {agent}")
 
-    def _get_translation_prompt_template(
+    def _get_translation_prompt_template(self) -> str:
+        """Return the raw prompt template, read from disk only once."""
+        if self._prompt_template is None:
+            with open(
+                self._settings.paths.translation_prompt_path, "r", encoding="utf-8"
+            ) as f:
+                self._prompt_template = f.read()
+        return self._prompt_template
+
+    def _get_translation_prompt_parts(
         self, source_lang: str, target_lang: str
-    ) -> str:
-        with open(
-            self._settings.paths.translation_prompt_path, "r", encoding="utf-8"
-        ) as f:
-            prompt_template = f.read()
-        return prompt_template.format(source_lang=source_lang, target_lang=target_lang)
+    ) -> tuple[str, str]:
+        """
+        Return the prompt text before and after the chunk placeholder.
+
+        The languages are fixed for a whole text, so the template is formatted
+        once per language pair and each chunk prompt is a plain concatenation.
+        """
+        key = (source_lang, target_lang)
+        parts = self._prompt_parts.get(key)
+        if parts is None:
+            prompt = self._get_translation_prompt_template().format(
+                source_lang=source_lang,
+                target_lang=target_lang,
+                text_chunk=self._TEXT_CHUNK_PLACEHOLDER,
+            )
+            prefix, _, suffix = prompt.partition(self._TEXT_CHUNK_PLACEHOLDER)
+            parts = self._prompt_parts[key] = (prefix, suffix)
+        return parts
+
+    def _get_cache_key(
+        self, chunk: str, prompt_parts: tuple[str, str]
+    ) -> tuple[str, str, str] | None:
+        """Return the cache key for a chunk, or None if it is not worth caching."""
+        normalized = " ".join(chunk.split())
+        if len(normalized) < self._MIN_CACHEABLE_LENGTH or normalized.isdigit():
+            return None
+        return (*prompt_parts, normalized)
+
+    def _should_translate(self, chunk: str) -> bool:
+        """Return False for chunks the LLM would only echo back."""
+        stripped = chunk.strip()
+        return not (
+            UNTRANSLATABLE_CHUNK_PATTERN.fullmatch(stripped)
+            or self._URL_CHUNK_PATTERN.fullmatch(stripped)
+            or self._MARKER_CHUNK_PATTERN.fullmatch(stripped)
+        )
 
     def _translate_single_chunk(
-        self, chunk: str, chunk_index: int, base_prompt_template: str
-    ) -> str:
-        prompt = base_prompt_template.format(text_chunk=chunk)
-        try:
-            translated_chunk = self.llm_client.call_model(prompt)
-            return translated_chunk if translated_chunk is not None else ""
-        except Exception as e:
-            logger.error(f"Error during LLM call for chunk {chunk_index + 1}: {e}")
-            return self._ERROR_CHUNK_MARKER_FORMAT.format(index=chunk_index + 1)
+        self, chunk: str, chunk_index: int, prompt_parts: tuple[str, str]
+    ) -> str | None:
+        """Translate one chunk; returns None when every LLM attempt failed."""
+        if not self._should_translate(chunk):
+            logger.debug(f"Chunk {chunk_index + 1}: nothing to translate, kept as-is")
+            return chunk.strip()
+
+        cache_key = self._get_cache_key(chunk, prompt_parts)
+        if cache_key is not None:
+            with self._translation_cache_lock:
+                cached = self._translation_cache.get(cache_key)
+                if cached is not None:
+                    self._translation_cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.debug(f"Chunk {chunk_index + 1}: served from translation cache")
+                return cached
+
+        prefix, suffix = prompt_parts
+        prompt = prefix + chunk + suffix
+        for attempt in range(1, self._MAX_CHUNK_ATTEMPTS + 1):
+            try:
+                translated_chunk = self.llm_client.call_model(prompt)
+                break
+            except Exception as e:
+                logger.error(
+                    f"Error during LLM call for chunk {chunk_index + 1} "
+                    f"(attempt {attempt}/{self._MAX_CHUNK_ATTEMPTS}): {e}"
+                )
+        else:
+            return None
+
+        if translated_chunk is None:
+            return ""
+        if cache_key is not None:
+            with self._translation_cache_lock:
+                self._translation_cache[cache_key] = translated_chunk
+                if len(self._translation_cache) > self._TRANSLATION_CACHE_SIZE:
+                    self._translation_cache.popitem(last=False)
+        return translated_chunk
 
     def _translate_chunks(
         self, chunks: list[str], source_lang: str, target_lang: str
     ) -> list[str]:
-        translated_chunks = []
-        prompt_template = self._get_translation_prompt_template(
-            source_lang, target_lang
+        prompt_parts = self._get_translation_prompt_parts(source_lang, target_lang)
+        translated: list[str] = [""] * len(chunks)
+        # Repeated chunks (headers, scene breaks, boilerplate) hit the model
+        # once; concurrent calls would all miss the cache before it is filled
+        positions_by_chunk: dict[str, list[int]] = {}
+        skipped = 0
+
+        for i, chunk in enumerate(chunks):
+            normalized = " ".join(chunk.split())
+            if not self._should_translate(chunk):
+                translated[i] = chunk.strip()
+                skipped += 1
+            elif normalized in positions_by_chunk:
+                positions_by_chunk[normalized].append(i)
+                skipped += 1
+            else:
+                positions_by_chunk[normalized] = [i]
+
+        if skipped:
+            logger.info(
+                f"Skipping LLM call for {skipped} of {len(chunks)} chunks "
+                "that are trivial or repeated"
+            )
+
+        pending = [
+            (positions[0], chunks[positions[0]])
+            for positions in positions_by_chunk.values()
+        ]
+        outcomes = asyncio.run(
+            self._translate_chunks_concurrently(pending, prompt_parts)
         )
 
-        if self._progress:
-            iterator = self._progress(enumerate(chunks), desc="Translating Chunks...")
-        else:
-            iterator = enumerate(chunks)
+        for positions, outcome in zip(
+            positions_by_chunk.values(), outcomes, strict=True
+        ):
+            for position in positions:
+                translated[position] = (
+                    self._ERROR_CHUNK_MARKER_FORMAT.format(index=position + 1)
+                    if outcome is None
+                    else outcome
+                )
+        return translated
+
+    async def _translate_chunks_concurrently(
+        self, chunks: list[tuple[int, str]], prompt_parts: tuple[str, str]
+    ) -> list[str | None]:
+        """
+        Translate (index, chunk) pairs with at most `concurrency` LLM calls
+        in flight.
 
-        for i, chunk in iterator:
-            translated_chunk = self._translate_single_chunk(chunk, i, prompt_template)
-            translated_chunks.append(translated_chunk)
+        The LLM clients are synchronous, so each call runs in a worker thread;
+        results come back in the order of `chunks`.
+        """
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def translate(index: int, chunk: str) -> str | None:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._translate_single_chunk, chunk, index, prompt_parts
+                )
+
+        tasks = [asyncio.ensure_future(translate(i, chunk)) for i, chunk in chunks]
+        if self._progress:
+            for task in self._progress(
+                asyncio.as_completed(tasks),
+                desc="Translating Chunks...",
+                total=len(tasks),
+            ):
+                await task
+        return list(await asyncio.gather(*tasks))
 
-        return translated_chunks
+    def _get_language_for_split(self, source_lang: str) -> BCP47Language:
+        """Map source language to BCP47Language for NLTK splitting."""
+        return SPLIT_LANGUAGES.get(source_lang.lower(), BCP47Language.ENGLISH)
 
     def translate_text(self, full_text: str, source_lang: str, target_lang: str) -> str:
-        # Map source language to BCP47Language for NLTK splitting
-        split_lang_map = {
-            "en": BCP47Language.ENGLISH,
-            "es": BCP47Language.SPANISH,
-            "zh": BCP47Language.CHINESE,
-            "ja": BCP47Language.JAPANESE,
-            "ko": BCP47Language.KOREAN,
-            "fr": BCP47Language.FRENCH,
-            "de": BCP47Language.GERMAN,
-            "it": BCP47Language.ITALIAN,
-            "pt": BCP47Language.PORTUGUESE,
-            "ru": BCP47Language.RUSSIAN,
-            "ar": BCP47Language.ARABIC,
-            "hi": BCP47Language.HINDI,
-        }
-        split_lang = split_lang_map.get(source_lang.lower(), BCP47Language.ENGLISH)
+        split_lang = self._get_language_for_split(source_lang)
 
         # Split text into chunks using adaptive chunking with language pair
         original_chunks = self.llm_client.split_into_limit(
@@ -119,6 +285,8 @@ class Translator:
 
         logger.info("Translation of all chunks completed.")
         full_translated_text = "\n\n".join(translated_text_parts)
-        full_translated_text = re.sub(r"\n{3,}", "\n\n", full_translated_text).strip()
+        full_translated_text = TRIPLE_NEWLINE_PATTERN.sub(
+            "\n\n", full_translated_text
+        ).strip()
 
         return full_translated_text
@@ -45,6 +45,32 @@ class TestGenerateAudioCommand:
             assert result is True
             mock_audio_gen.return_value.process_texts.assert_called_once()
 
+    def test_generate_chapter_audio_reuses_generator(self, mock_pool, tmp_path):
+        """A provided AudioGenerator is used instead of building a new one."""
+        from pdftranslator.cli.commands.generate_audio import _generate_chapter_audio
+        from pdftranslator.core.models.work import Chapter, Volume, Work
+
+        chapter = Chapter(
+            id=1, volume_id=1, chapter_number=4, translated_text="Translated text"
+        )
+        volume = Volume(id=1, work_id=1, volume_number=1)
+        work = Work(id=1, title="TestWork")
+        settings = MagicMock()
+        settings.paths.audiobooks_dir = tmp_path
+        audio_generator = MagicMock()
+        audio_generator.process_texts.return_value = True
+
+        with patch(
+            "pdftranslator.cli.commands.generate_audio.AudioGenerator"
+        ) as mock_audio_gen:
+            result = _generate_chapter_audio(
+                chapter, volume, work, settings, audio_generator
+            )
+
+        assert result is True
+        mock_audio_gen.assert_not_called()
+        audio_generator.process_texts.assert_called_once()
+
     def test_generate_chapter_audio_no_translation(self, mock_pool):
         """Test audio generation when chapter has no translated text."""
         from pdftranslator.cli.commands.generate_audio import _generate_chapter_audio
@@ -117,6 +143,40 @@ class TestGenerateAudioCommand:
             assert skip == 0
             assert fail == 0
 
+    def test_generate_volume_audio_parallel(self, mock_pool):
+        """Chapters are tallied correctly when generated by several workers."""
+        from pdftranslator.cli.commands.generate_audio import _generate_volume_audio
+        from pdftranslator.core.models.work import Chapter, Volume, Work
+
+        chapters = [
+            Chapter(id=1, volume_id=1, chapter_number=1, translated_text="One"),
+            Chapter(id=2, volume_id=1, chapter_number=2, translated_text=None),
+            Chapter(id=3, volume_id=1, chapter_number=3, translated_text="Three"),
+        ]
+        volume = Volume(id=1, work_id=1, volume_number=1)
+        work = Work(id=1, title="TestWork")
+
+        mock_chapter_repo = MagicMock()
+        mock_chapter_repo.get_by_volume.return_value = chapters
+
+        with patch(
+            "pdftranslator.cli.commands.generate_audio.AudioGenerator"
+        ) as mock_audio_cls, patch(
+            "pdftranslator.cli.commands.generate_audio._generate_chapter_audio"
+        ) as mock_gen, patch(
+            "pdftranslator.cli.commands.generate_audio.os.cpu_count", return_value=8
+        ):
+            mock_gen.side_effect = lambda chapter, *args: chapter.id == 1
+
+            success, skip, fail = _generate_volume_audio(
+                volume, work, MagicMock(), mock_chapter_repo, workers=2
+            )
+
+        assert (success, skip, fail) == (1, 1, 1)
+        assert mock_gen.call_count == 3
+        # Each of the 2 workers gets half of the 8 cores for 'say' processes
+        mock_audio_cls.assert_called_with(max_workers=4)
+
     def test_format_chapter_display(self):
         """Test chapter display formatting."""
         from pdftranslator.cli.commands.generate_audio import _format_chapter_display
@@ -145,3 +205,13 @@ class TestGenerateAudioCommand:
         assert sorted_chapters[1].chapter_number == 1
         assert sorted_chapters[2].chapter_number == 2
         assert sorted_chapters[3].title == "Epilogue"
+
+    def test_list_existing_audio(self, tmp_path):
+        """Test existing audio listing for present and missing directories."""
+        from pdftranslator.cli.commands.generate_audio import _list_existing_audio
+
+        (tmp_path / "Work_Vol1_Ch001.m4a").write_text("audio")
+        (tmp_path / "subdir").mkdir()
+
+        assert _list_existing_audio(tmp_path) == {"Work_Vol1_Ch001.m4a"}
+        assert _list_existing_audio(tmp_path / "missing") == set()
@@ -70,6 +70,18 @@ def test_get_by_volume(mock_pool, mock_connection):
     assert result[1].chapter_number == 2
 
 
+def test_count_by_volume(mock_pool):
+    conn = MagicMock()
+    conn.execute.return_value.fetchone.return_value = (3, 2)
+    mock_pool.connection.return_value.__enter__.return_value = conn
+
+    repo = ChapterRepository(pool=mock_pool)
+    total, translated = repo.count_by_volume(1)
+
+    assert (total, translated) == (3, 2)
+    assert conn.execute.call_args[0][1] == (1,)
+
+
 def test_search_content(mock_pool, mock_connection):
     mock_pool.get_sync_pool.return_value.connection.return_value.__enter__ = MagicMock(
         return_value=mock_connection[0]
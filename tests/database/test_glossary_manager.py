@@ -134,6 +134,38 @@ class TestGlossaryManager:
 
                         assert isinstance(translations, dict)
 
+    @patch("pdftranslator.database.services.glossary_manager.VectorStoreService")
+    @patch(
+        "pdftranslator.database.services.glossary_manager.GlossaryBuildProgressRepository"
+    )
+    @patch("pdftranslator.database.services.glossary_manager.GlossaryRepository")
+    @patch("pdftranslator.database.services.glossary_manager.EntityExtractor")
+    def test_suggest_translations_only_translates_missing(
+        self, mock_extractor_cls, mock_glossary_cls, mock_progress_cls,
+        mock_vector_cls, mock_pool,
+    ):
+        mock_llm = Mock()
+        mock_llm.call_model.return_value = '{"Queen": "Reina"}'
+        mock_llm._settings.llm.nvidia.max_output_tokens = 4096
+
+        manager = GlossaryManager(mock_pool)
+        manager._llm_client = mock_llm
+
+        entities = [
+            EntityCandidate(
+                text="Alice", entity_type="character", frequency=2,
+                translation="Alicia",
+            ),
+            EntityCandidate(text="Queen", entity_type="title", frequency=1),
+        ]
+        translations = manager._suggest_translations(entities, "en", "es")
+
+        assert translations == {"Alice": "Alicia", "Queen": "Reina"}
+        mock_llm.call_model.assert_called_once()
+        prompt = mock_llm.call_model.call_args[0][0]
+        assert '"Queen"' in prompt
+        assert '"Alice"' not in prompt
+
     def test_get_glossary_for_work(self, mock_pool, mock_connection):
         mock_pool.get_sync_pool.return_value.connection.return_value.__enter__ = (
             MagicMock(return_value=mock_connection[0])
@@ -0,0 +1,87 @@
+"""Tests for OllamaLLM chunk sizing."""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from pdftranslator.core.config.llm import OllamaConfig
+from pdftranslator.core.config.settings import Settings
+from pdftranslator.infrastructure.llm.ollama import PRELOAD_TIMEOUT, OllamaLLM
+
+
+class TestOllamaLLMChunking:
+    """Tests for context-aware chunk sizing in OllamaLLM."""
+
+    @pytest.fixture
+    def ollama_llm(self, tmp_path):
+        """Create OllamaLLM with a 100-token prompt and no server calls."""
+        prompt_path = tmp_path / "translation_prompt.txt"
+        prompt_path.write_text(
+            "{source_lang} -> {target_lang}: {text_chunk}", encoding="utf-8"
+        )
+        settings = Mock(spec=Settings)
+        settings.llm.ollama = OllamaConfig(
+            context_size=4096,
+            chunk_safety_margin_pct=0.10,
+            min_chunk_tokens=256,
+            preload_model=False,
+        )
+        settings.paths.translation_prompt_path = prompt_path
+
+        with patch("pdftranslator.infrastructure.llm.ollama.AutoTokenizer"), patch(
+            "pdftranslator.infrastructure.llm.ollama.ChatOllama"
+        ):
+            llm = OllamaLLM(settings)
+        llm._tokenizer = Mock()
+        llm._tokenizer.encode.return_value = list(range(100))
+        return llm
+
+    def test_chunk_size_leaves_room_for_prompt_and_output(self, ollama_llm):
+        """Prompt, chunk and expected translation fit in the context window."""
+        chunk_size = ollama_llm._get_chunk_size("en", "es")
+
+        # (4096 - 100) / (1 + 1.30) * 0.90
+        assert chunk_size == 1564
+        assert 100 + chunk_size * (1 + 1.30) < 4096
+
+    def test_chunk_size_uses_custom_expansion_ratio(self, ollama_llm):
+        """Configured expansion_ratios override the built-in defaults."""
+        settings = ollama_llm._settings
+        settings.llm.ollama.expansion_ratios = {"en-es": 1.0}
+        with patch("pdftranslator.infrastructure.llm.ollama.AutoTokenizer"), patch(
+            "pdftranslator.infrastructure.llm.ollama.ChatOllama"
+        ):
+            llm = OllamaLLM(settings)
+        llm._tokenizer = ollama_llm._tokenizer
+
+        # (4096 - 100) / (1 + 1.0) * 0.90
+        assert llm._get_chunk_size("en", "es") == 1798
+
+    def test_chunk_size_cached_per_language_pair(self, ollama_llm):
+        """The prompt is measured once per language pair."""
+        ollama_llm._get_chunk_size("en", "es")
+        ollama_llm._get_chunk_size("EN", "ES")
+        calls = ollama_llm._tokenizer.encode.call_count
+
+        ollama_llm._get_chunk_size("en", "zh")
+
+        assert calls == 1
+        assert ollama_llm._tokenizer.encode.call_count == 2
+
+    def test_text_splitter_reused_across_calls(self, ollama_llm):
+        """split_into_limit builds one splitter per chunk size and language."""
+        from pdftranslator.core.config.llm import BCP47Language
+
+        ollama_llm.split_into_limit("One. Two.", BCP47Language.ENGLISH, "en", "es")
+        ollama_llm.split_into_limit("Three.", BCP47Language.ENGLISH, "en", "es")
+        ollama_llm.split_into_limit("Uno.", BCP47Language.SPANISH, "en", "es")
+
+        assert len(ollama_llm._text_splitters) == 2
+
+    def test_preload_failure_only_warns(self, ollama_llm, caplog):
+        """An unreachable server is logged, with the short preload timeout."""
+        with patch("pdftranslator.infrastructure.llm.ollama.Client") as client_cls:
+            client_cls.return_value.generate.side_effect = ConnectionError("down")
+            ollama_llm._preload_model(ollama_llm._settings.llm.ollama)
+
+        client_cls.assert_called_once_with(timeout=PRELOAD_TIMEOUT)
+        assert "Could not preload Ollama model" in caplog.text
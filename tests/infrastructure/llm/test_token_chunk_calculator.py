@@ -4,7 +4,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from pdftranslator.core.config.llm import NvidiaConfig
+from pdftranslator.core.config.llm import NvidiaConfig, OllamaConfig
 from pdftranslator.infrastructure.llm.protocol import LLMClient
 from pdftranslator.infrastructure.llm.token_chunk_calculator import TokenChunkCalculator
 
@@ -118,6 +118,25 @@ class TestTokenChunkCalculator:
         chunk = calculator.calculate_chunk_size(prompt_tokens=100, expansion_ratio=0.5)
         assert chunk == 26326  # Bound by context
 
+    def test_calculate_shared_context_chunk_size(self, mock_llm):
+        """Prompt, chunk and expanded output share one context window."""
+        config = OllamaConfig(
+            context_size=4096, chunk_safety_margin_pct=0.10, min_chunk_tokens=256
+        )
+        calculator = TokenChunkCalculator(mock_llm, config)
+
+        # (4096 - 100) / (1 + 1.30) * 0.90 = 1564
+        chunk = calculator.calculate_shared_context_chunk_size(
+            prompt_tokens=100, expansion_ratio=1.30
+        )
+        assert chunk == 1564
+
+        # Prompt larger than the window -> floor at min_chunk_tokens
+        chunk = calculator.calculate_shared_context_chunk_size(
+            prompt_tokens=5000, expansion_ratio=1.30
+        )
+        assert chunk == 256
+
     def test_validate_response_not_truncated_under_threshold(
         self, calculator, mock_llm
     ):
@@ -244,3 +244,33 @@ def test_orchestrator_execute_job_single_chapter():
         final_job = mock_job_repo.update.call_args[0][0]
         assert final_job.status == "completed"
         assert final_job.success_count == 1
+
+
+def test_orchestrator_execute_job_throttles_skipped_progress():
+    mock_chapter_repo = MagicMock()
+    mock_glossary_repo = MagicMock()
+    mock_job_repo = MagicMock()
+
+    job = TranslationJob(
+        id=1, work_id=1, scope="all_volume", volume_id=1,
+        source_lang="en", target_lang="es",
+    )
+    chapters = [
+        Chapter(id=i, volume_id=1, chapter_number=i, original_text="Text",
+                translated_text="Texto")
+        for i in range(1, 51)
+    ]
+    mock_chapter_repo.get_by_volume.return_value = chapters
+
+    orchestrator = TranslationOrchestrator(
+        chapter_repo=mock_chapter_repo,
+        glossary_repo=mock_glossary_repo,
+        job_repo=mock_job_repo,
+    )
+    orchestrator.execute_job(job)
+
+    # in_progress, total, first skipped burst write, final: not one per chapter
+    assert mock_job_repo.update.call_count < len(chapters)
+    final_job = mock_job_repo.update.call_args[0][0]
+    assert final_job.status == "completed"
+    assert final_job.completed_chapters == len(chapters)
@@ -0,0 +1,99 @@
+"""Tests for TranslatorService chunk handling."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pdftranslator.services.translator import TranslatorService
+
+
+@pytest.fixture
+def service(tmp_path):
+    prompt_path = tmp_path / "translation_prompt.txt"
+    prompt_path.write_text(
+        "{source_lang} -> {target_lang}: {text_chunk}", encoding="utf-8"
+    )
+    settings = MagicMock()
+    settings.paths.translation_prompt_path = prompt_path
+    settings.processing.translation_concurrency = 4
+
+    factory = MagicMock()
+    llm_client = factory.create.return_value
+    llm_client.count_tokens.return_value = 10
+    llm_client.call_model.side_effect = lambda prompt: prompt.upper()
+
+    return TranslatorService(factory, settings=settings)
+
+
+def test_trivial_chunks_skip_llm(service):
+    """Page numbers and punctuation-only chunks are kept as-is."""
+    service._llm_client.split_into_limit.return_value = ["12", "* * *", "   "]
+
+    result = service.translate("ignored", "en", "es")
+
+    service._llm_client.call_model.assert_not_called()
+    assert result.success
+    assert result.translated_chunks == 3
+    assert "12" in result.text
+    assert "* * *" in result.text
+
+
+def test_repeated_chunks_translated_once(service):
+    """Identical chunks reuse the first translation."""
+    service._llm_client.split_into_limit.return_value = [
+        "Chapter One",
+        "Body text.",
+        "Chapter One",
+    ]
+
+    result = service.translate("ignored", "en", "es")
+
+    assert service._llm_client.call_model.call_count == 2
+    assert result.text == (
+        "EN -> ES: CHAPTER ONE\n\nEN -> ES: BODY TEXT.\n\nEN -> ES: CHAPTER ONE"
+    )
+
+
+def test_chunks_translated_concurrently_in_order(service):
+    """Chunks overlap in flight, up to the limit, and keep their order."""
+    service._max_concurrency = 2
+    service._llm_client.split_into_limit.return_value = ["one", "two", "three"]
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_upper(prompt):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return prompt.upper()
+
+    service._llm_client.call_model.side_effect = slow_upper
+
+    result = service.translate("ignored", "en", "es")
+
+    assert peak == 2
+    assert result.text == "EN -> ES: ONE\n\nEN -> ES: TWO\n\nEN -> ES: THREE"
+
+
+def test_failed_chunk_replaced_with_marker(service):
+    """A failing chunk is reported without aborting the other chunks."""
+    service._llm_client.split_into_limit.return_value = ["good", "bad"]
+
+    def fail_on_bad(prompt):
+        if "bad" in prompt:
+            raise RuntimeError("boom")
+        return prompt.upper()
+
+    service._llm_client.call_model.side_effect = fail_on_bad
+
+    result = service.translate("ignored", "en", "es")
+
+    assert result.errors == ["Chunk 2: boom"]
+    assert result.text == "EN -> ES: GOOD\n\n[TRANSLATION_ERROR_CHUNK_2]"
@@ -0,0 +1,31 @@
+"""Tests for FileFinder directory scan caching."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+from pdftranslator.tools.FileFinder import (
+    ExcludeTranslatedFilter,
+    FileFinder,
+    IsFileFilter,
+)
+
+
+def test_get_files_scans_directory_once(tmp_path):
+    """Repeated searches reuse the scan until refresh() is called."""
+    (tmp_path / "book.pdf").write_bytes(b"")
+    (tmp_path / "translated_book.pdf").write_bytes(b"")
+    finder = FileFinder(str(tmp_path))
+    filters = [IsFileFilter(), ExcludeTranslatedFilter()]
+
+    with patch.object(
+        Path, "rglob", autospec=True, side_effect=Path.rglob
+    ) as mock_rglob:
+        first = finder.get_files("pdf", filters)
+        (tmp_path / "new.pdf").write_bytes(b"")
+        second = finder.get_files("pdf", filters)
+        finder.refresh()
+        third = finder.get_files("pdf", filters)
+
+    assert first == second == [tmp_path / "book.pdf"]
+    assert third == [tmp_path / "book.pdf", tmp_path / "new.pdf"]
+    assert mock_rglob.call_count == 2
@@ -56,3 +56,74 @@ def test_extract_text_error_returns_none():
     # Test with non-existent file
     result = extractor.extract_text("/non/existent/file.pdf")
     assert result is None, "Should return None for non-existent file"
+
+
+def test_parallel_pdf_extraction_keeps_page_order(tmp_path):
+    """Page ranges extracted in worker processes are joined in page order."""
+    import fitz
+    from tools.TextExtractor import MIN_PDF_PAGES_PER_WORKER
+
+    pdf_path = tmp_path / "book.pdf"
+    page_count = MIN_PDF_PAGES_PER_WORKER * 2
+    with fitz.open() as doc:
+        for i in range(page_count):
+            doc.new_page().insert_text((72, 72), f"Line {i}")
+        doc.save(pdf_path)
+
+    sequential = TextExtractor(max_workers=1)._extract_from_pdf(pdf_path)
+    parallel = TextExtractor(max_workers=2)._extract_from_pdf(pdf_path)
+
+    assert parallel == sequential
+    assert parallel.index("Line 0") < parallel.index(f"Line {page_count - 1}")
+
+
+def test_process_epub_item_strips_removed_tags():
+    """EPUB items are cleaned by a picklable module-level function."""
+    from tools.TextExtractor import _process_epub_item
+
+    body = b"<nav>Contents</nav><p>First</p>\n\n\n<p>Second</p><script>x()</script>"
+
+    result = _process_epub_item("ch1.xhtml", body, ["nav", "script"])
+
+    assert result == "First\nSecond"
+
+
+def test_extract_epub_reads_manifest_documents_in_order(tmp_path):
+    """EPUB documents are read straight from the zip in manifest order."""
+    import zipfile
+
+    epub_path = tmp_path / "book.epub"
+    with zipfile.ZipFile(epub_path, "w") as archive:
+        archive.writestr("mimetype", "application/epub+zip")
+        archive.writestr(
+            "META-INF/container.xml",
+            '<container xmlns="urn:oasis:names:tc:opendocument:xmlns:container">'
+            '<rootfiles><rootfile full-path="OEBPS/content.opf"/></rootfiles>'
+            "</container>",
+        )
+        archive.writestr(
+            "OEBPS/content.opf",
+            '<package xmlns="http://www.idpf.org/2007/opf"><manifest>'
+            '<item id="c2" href="Text/ch2.xhtml" media-type="application/xhtml+xml"/>'
+            '<item id="css" href="style.css" media-type="text/css"/>'
+            '<item id="c1" href="Text/ch%201.xhtml" media-type="application/xhtml+xml"/>'
+            "</manifest></package>",
+        )
+        archive.writestr("OEBPS/style.css", "p { color: red; }")
+        archive.writestr(
+            "OEBPS/Text/ch2.xhtml",
+            "<html><head><title>Ignored</title></head>"
+            "<body><p>Second chapter</p></body></html>",
+        )
+        archive.writestr(
+            "OEBPS/Text/ch 1.xhtml",
+            "<html><body><nav>Contents</nav><p>First chapter</p></body></html>",
+        )
+
+    extractor = TextExtractor(max_workers=1)
+    sections = extractor.iter_epub_sections(epub_path)
+    result = extractor._extract_from_epub(epub_path)
+
+    assert not isinstance(sections, list)
+    assert list(sections) == ["Second chapter", "First chapter"]
+    assert result == "Second chapter\n\nFirst chapter"
@@ -0,0 +1,168 @@
+"""Tests for Translator prompt template caching."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pdftranslator.tools.Translator import Translator
+
+TEMPLATE = (
+    "Translate from {source_lang} to {target_lang}.\n"
+    "{text_chunk}\n"
+    "Target Language: {target_lang}"
+)
+
+
+@pytest.fixture
+def translator(tmp_path):
+    prompt_path = tmp_path / "translation_prompt.txt"
+    prompt_path.write_text(TEMPLATE, encoding="utf-8")
+
+    with patch.object(Translator, "_create_llm_client", return_value=MagicMock()):
+        translator = Translator()
+    translator._settings = MagicMock()
+    translator._settings.paths.translation_prompt_path = prompt_path
+    return translator
+
+
+def test_prompt_parts_match_formatted_template(translator):
+    """Concatenating the cached parts yields the fully formatted prompt."""
+    chunk = "Some {braced} text"
+    prefix, suffix = translator._get_translation_prompt_parts("en", "es")
+
+    expected = TEMPLATE.format(source_lang="en", target_lang="es", text_chunk=chunk)
+    assert prefix + chunk + suffix == expected
+
+
+def test_prompt_template_read_once(translator):
+    """The template file is read once and parts are cached per language pair."""
+    with patch("builtins.open", wraps=open) as mock_open:
+        first = translator._get_translation_prompt_parts("en", "es")
+        second = translator._get_translation_prompt_parts("en", "es")
+        other = translator._get_translation_prompt_parts("en", "fr")
+
+    assert first is second
+    assert first != other
+    assert mock_open.call_count == 1
+
+
+def test_translate_single_chunk_sends_full_prompt(translator):
+    """The LLM receives the prefix, chunk and suffix in order."""
+    translator.llm_client.call_model.return_value = "Hola"
+    parts = translator._get_translation_prompt_parts("en", "es")
+
+    result = translator._translate_single_chunk("Hello", 0, parts)
+
+    assert result == "Hola"
+    translator.llm_client.call_model.assert_called_once_with(
+        parts[0] + "Hello" + parts[1]
+    )
+
+
+def test_repeated_chunk_served_from_cache(translator):
+    """Chunks differing only in whitespace reuse the first translation."""
+    translator.llm_client.call_model.return_value = "Capítulo uno"
+    parts = translator._get_translation_prompt_parts("en", "es")
+
+    first = translator._translate_single_chunk("Chapter  One", 0, parts)
+    second = translator._translate_single_chunk("Chapter One\n", 5, parts)
+
+    assert first == second == "Capítulo uno"
+    translator.llm_client.call_model.assert_called_once()
+
+
+def test_short_numeric_and_failed_chunks_not_cached(translator):
+    """Page numbers are never cached and failures are retried next time."""
+    parts = translator._get_translation_prompt_parts("en", "es")
+    translator.llm_client.call_model.side_effect = [RuntimeError("boom"), "Hola", "12"]
+
+    assert translator._translate_single_chunk("Hello", 0, parts) is None
+    assert translator._translate_single_chunk("Hello", 1, parts) == "Hola"
+    translator._translate_single_chunk("12", 2, parts)
+
+    assert translator._translation_cache == {(*parts, "Hello"): "Hola"}
+
+
+@pytest.mark.parametrize(
+    "chunk",
+    [
+        "12",
+        "  * * *  ",
+        "",
+        "https://example.com/a www.example.org",
+        "[TRANSLATION_ERROR_CHUNK_3]\n[EMPTY_TRANSLATION_CHUNK_4]",
+    ],
+)
+def test_untranslatable_chunks_skip_llm(translator, chunk):
+    """Numbers, separators, URLs and markers are returned without an LLM call."""
+    parts = translator._get_translation_prompt_parts("en", "es")
+
+    assert translator._translate_single_chunk(chunk, 0, parts) == chunk.strip()
+    translator.llm_client.call_model.assert_not_called()
+
+
+def test_translate_chunks_bounded_concurrency_keeps_order(translator):
+    """Chunks overlap up to the concurrency limit and keep their order."""
+    translator._concurrency = 2
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_call(prompt):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return prompt.split("\n")[1].upper()
+
+    translator.llm_client.call_model.side_effect = slow_call
+
+    result = translator._translate_chunks(["one", "two", "three"], "en", "es")
+
+    assert result == ["ONE", "TWO", "THREE"]
+    assert peak == 2
+
+
+def test_failed_call_retried_up_to_max_attempts(translator):
+    """Subclasses such as GlossaryAwareTranslator retry a bounded number of times."""
+    translator._MAX_CHUNK_ATTEMPTS = 2
+    parts = translator._get_translation_prompt_parts("en", "es")
+    translator.llm_client.call_model.side_effect = [
+        RuntimeError("boom"),
+        "Hola",
+        RuntimeError("boom"),
+        RuntimeError("boom"),
+    ]
+
+    assert translator._translate_single_chunk("Hello", 0, parts) == "Hola"
+    assert translator._translate_single_chunk("Goodbye", 1, parts) is None
+    assert translator.llm_client.call_model.call_count == 4
+
+
+def test_repeated_chunks_translated_once_concurrently(translator):
+    """Identical chunks in one call share a single LLM call and keep their slots."""
+    translator._concurrency = 4
+    translator.llm_client.call_model.side_effect = lambda prompt: (
+        prompt.split("\n")[1].upper()
+    )
+
+    result = translator._translate_chunks(
+        ["Scene break", "one", "Scene  break\n", "12"], "en", "es"
+    )
+
+    assert result == ["SCENE BREAK", "ONE", "SCENE BREAK", "12"]
+    assert translator.llm_client.call_model.call_count == 2
+
+
+def test_repeated_failed_chunk_marked_at_each_position(translator):
+    """A failing repeated chunk gets an error marker numbered per position."""
+    translator.llm_client.call_model.side_effect = RuntimeError("boom")
+
+    result = translator._translate_chunks(["Hello", "Hello"], "en", "es")
+
+    assert result == ["[TRANSLATION_ERROR_CHUNK_1]", "[TRANSLATION_ERROR_CHUNK_2]"]